@@ -7,6 +7,40 @@ from typing import Dict, Any, List, Optional
 from google import genai
 from google.genai import types
 
+# HTTP/2 multiplexing needs the optional h2 package; fall back to HTTP/1.1
+# keep-alive when it isn't installed
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# One SDK client (and its pooled transport) per API key, shared by every
+# GeminiClient instance so node executions reuse warm TLS connections
+_SDK_CLIENTS: Dict[str, genai.Client] = {}
+
+
+def _get_sdk_client(api_key: str) -> genai.Client:
+    """Return a cached genai.Client with a pooled HTTP transport."""
+    client = _SDK_CLIENTS.get(api_key)
+    if client is None:
+        client = None
+        if _HTTP2_AVAILABLE:
+            # client_args only exists on newer google-genai releases; older
+            # versions that still satisfy our pin reject the field, so fall
+            # back to a plain client rather than failing node construction
+            try:
+                client = genai.Client(
+                    api_key=api_key,
+                    http_options=types.HttpOptions(client_args={"http2": True})
+                )
+            except (TypeError, ValueError):
+                client = None
+        if client is None:
+            client = genai.Client(api_key=api_key)
+        _SDK_CLIENTS[api_key] = client
+    return client
+
 
 class GeminiClient:
     """
@@ -58,8 +92,8 @@ class GeminiClient:
         # Resolve API key from multiple sources
         self.api_key = self._resolve_api_key(api_key, config_path)
 
-        # Initialize the client
-        self.client = genai.Client(api_key=self.api_key)
+        # Initialize the client (shared transport, keyed on API key)
+        self.client = _get_sdk_client(self.api_key)
 
         # Store configuration for later use
         self.system_instruction = None
@@ -127,34 +161,24 @@ class GeminiClient:
         if safety_settings:
             self.safety_settings = safety_settings
 
-    def generate_content(
+    def _build_generation_config(
         self,
-        prompt: str,
-        images: Optional[List[Any]] = None,
         max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-        **kwargs
-    ) -> Dict[str, Any]:
+        temperature: Optional[float] = None
+    ) -> types.GenerateContentConfig:
         """
-        Generate content using Gemini API.
+        Build a GenerateContentConfig with client defaults applied.
 
         Args:
-            prompt: Text prompt
-            images: Optional list of PIL Images for vision tasks
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0-2.0)
-            **kwargs: Additional parameters
 
         Returns:
-            Response dict with 'text' and metadata
+            Configured GenerateContentConfig
         """
-        max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
-        temperature = temperature if temperature is not None else self.DEFAULT_TEMPERATURE
-
-        # Build generation config
         config = types.GenerateContentConfig(
-            max_output_tokens=max_tokens,
-            temperature=temperature,
+            max_output_tokens=max_tokens or self.DEFAULT_MAX_TOKENS,
+            temperature=temperature if temperature is not None else self.DEFAULT_TEMPERATURE,
         )
 
         # Add system instruction if set
@@ -165,11 +189,40 @@ class GeminiClient:
         if self.safety_settings:
             config.safety_settings = self.safety_settings
 
-        # Build content list (images + text)
+        return config
+
+    @staticmethod
+    def _build_contents(prompt: str, images: Optional[List[Any]] = None) -> List[Any]:
+        """Build the content list (images + text) for a request."""
         contents = []
         if images:
             contents.extend(images)
         contents.append(prompt)
+        return contents
+
+    def generate_content(
+        self,
+        prompt: str,
+        images: Optional[List[Any]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate content using Gemini API.
+
+        Args:
+            prompt: Text prompt
+            images: Optional list of PIL Images for vision tasks
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-2.0)
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dict with 'text' and metadata
+        """
+        config = self._build_generation_config(max_tokens, temperature)
+        contents = self._build_contents(prompt, images)
 
         # Generate content
         response = self.client.models.generate_content(
@@ -195,6 +248,66 @@ class GeminiClient:
                 "error": str(e)
             }
 
+    def generate_content_stream(
+        self,
+        prompt: str,
+        images: Optional[List[Any]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate content using the streaming API, concatenating chunks.
+
+        First-byte latency drops to roughly one round trip instead of
+        full-generation time, while the return shape stays identical to
+        generate_content.
+
+        Args:
+            prompt: Text prompt
+            images: Optional list of PIL Images for vision tasks
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-2.0)
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dict with 'text' and metadata
+        """
+        config = self._build_generation_config(max_tokens, temperature)
+        contents = self._build_contents(prompt, images)
+
+        try:
+            stream = self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=contents,
+                config=config
+            )
+
+            # Accumulate via list + join to avoid O(n^2) string concat
+            parts = []
+            last_chunk = None
+            for chunk in stream:
+                parts.append(chunk.text or "")
+                last_chunk = chunk
+
+            finish_reason = "STOP"
+            if last_chunk is not None and last_chunk.candidates:
+                finish_reason = last_chunk.candidates[0].finish_reason
+
+            return {
+                "text": "".join(parts),
+                "blocked": False,
+                "finish_reason": finish_reason
+            }
+        except Exception as e:
+            # Response was blocked or error occurred
+            return {
+                "text": "",
+                "blocked": True,
+                "finish_reason": "ERROR",
+                "error": str(e)
+            }
+
     def start_chat(self, history: Optional[List[Dict[str, str]]] = None):
         """
         Start a chat session for multi-turn conversations.
@@ -1,11 +1,28 @@
 # ABOUTME: Utility classes for Gemini API integration
 # ABOUTME: Handles image conversion and safety settings configuration
 
+import os
+import weakref
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from typing import Dict, List
 from google.genai import types
 
+# Optional SIMD JPEG decoder; generated images come back as JPEG and
+# libjpeg-turbo decodes them straight to a uint8 array without PIL's
+# intermediate copies
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBO_JPEG = TurboJPEG()
+except Exception:
+    _TURBO_JPEG = None
+
+# Converted PIL lists shared across nodes that receive the same IMAGE wire
+# (e.g. GeminiVision + GeminiImageEdit in one graph). Keyed on the tensor's
+# data pointer + shape; entries are evicted when the tensor is freed.
+_PIL_CACHE: Dict = {}
+
 
 class ImageConverter:
     """
@@ -15,6 +32,26 @@ class ImageConverter:
     Gemini API accepts PIL Images directly.
     """
 
+    @staticmethod
+    def _array_to_pil(array: np.ndarray) -> Image.Image:
+        """
+        Convert a uint8 [H, W, C] array to a PIL Image.
+
+        frombuffer skips PIL's mode/shape inference but still copies for
+        RGB (only "L", "RGBX", "RGBA" and "CMYK" share the buffer), so
+        the result owns its pixels and is safe to use after the array is
+        reused or freed.
+
+        Args:
+            array: Contiguous uint8 array in HWC layout
+
+        Returns:
+            PIL Image
+        """
+        array = np.ascontiguousarray(array)
+        height, width = array.shape[:2]
+        return Image.frombuffer("RGB", (width, height), array, "raw", "RGB", 0, 1)
+
     @staticmethod
     def tensor_to_pil(tensor) -> Image.Image:
         """
@@ -35,11 +72,11 @@ class ImageConverter:
         if len(tensor.shape) == 4:
             tensor = tensor[0]  # Take first image in batch
 
-        # Convert to numpy and scale to [0, 255]
+        # Convert to numpy and scale to [0, 255] in one vectorized pass
         array = np.clip(255.0 * tensor.cpu().numpy(), 0, 255).astype(np.uint8)
 
-        # Convert to PIL
-        return Image.fromarray(array)
+        # Convert to PIL from the contiguous buffer
+        return ImageConverter._array_to_pil(array)
 
     @staticmethod
     def tensors_to_pil_list(tensors) -> List[Image.Image]:
@@ -57,18 +94,43 @@ class ImageConverter:
         except ImportError:
             raise ImportError("torch is required for tensor conversion")
 
-        images = []
         # If single tensor without batch dimension
         if len(tensors.shape) == 3:
-            images.append(ImageConverter.tensor_to_pil(tensors))
+            return [ImageConverter.tensor_to_pil(tensors)]
+
+        # Reuse a previous conversion of the same tensor (same buffer,
+        # shape and mutation counter), e.g. when vision and edit nodes
+        # share one IMAGE wire. _version bumps on every in-place op, so
+        # an edited tensor can't match its stale conversion
+        key = (
+            tensors.data_ptr(),
+            tuple(tensors.shape),
+            getattr(tensors, "_version", 0),
+        )
+        cached = _PIL_CACHE.get(key)
+        if cached is not None:
+            return list(cached)
+
+        batch = tensors.cpu().numpy()
+
+        def _convert(array):
+            # NumPy releases the GIL during clip/astype, so per-image
+            # conversion scales across threads on larger batches
+            array = np.clip(255.0 * array, 0, 255).astype(np.uint8)
+            return ImageConverter._array_to_pil(array)
+
+        if batch.shape[0] > 2:
+            workers = min(batch.shape[0], os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                images = list(executor.map(_convert, batch))
         else:
-            # Process each image in batch
-            for i in range(tensors.shape[0]):
-                tensor = tensors[i]
-                array = np.clip(255.0 * tensor.cpu().numpy(), 0, 255).astype(np.uint8)
-                images.append(Image.fromarray(array))
+            images = [_convert(batch[i]) for i in range(batch.shape[0])]
 
-        return images
+        _PIL_CACHE[key] = images
+        # Evict when the source tensor is freed so stale buffers can't match
+        weakref.finalize(tensors, _PIL_CACHE.pop, key, None)
+
+        return list(images)
 
     @staticmethod
     def pil_to_tensor(pil_image: Image.Image):
@@ -90,14 +152,49 @@ class ImageConverter:
         if pil_image.mode != 'RGB':
             pil_image = pil_image.convert('RGB')
 
-        # Convert to numpy array and normalize to [0, 1]
-        array = np.array(pil_image).astype(np.float32) / 255.0
-
-        # Add batch dimension and convert to tensor [1, H, W, C]
-        tensor = torch.from_numpy(array).unsqueeze(0)
+        # Wrap PIL's buffer as uint8, then normalize in-place on the tensor:
+        # one float32 allocation instead of separate astype + divide copies
+        array = np.asarray(pil_image, dtype=np.uint8)
+        tensor = torch.from_numpy(array).float().div_(255.0).unsqueeze(0)
 
         return tensor
 
+    @staticmethod
+    def pil_to_webp_part(pil_image: Image.Image, quality: int = 85) -> types.Part:
+        """
+        Compress a PIL Image to an in-memory WebP blob for upload.
+
+        The SDK re-encodes raw PIL images as lossless PNG, which is 5-10x
+        larger than WebP on photographic content. Gemini accepts image/webp
+        natively, so pre-compressing cuts upload time on large canvases.
+
+        Args:
+            pil_image: PIL Image to compress
+            quality: WebP quality (0-100)
+
+        Returns:
+            types.Part with WebP-encoded image data
+        """
+        from io import BytesIO
+
+        buf = BytesIO()
+        pil_image.save(buf, format="WEBP", quality=quality, method=4)
+        return types.Part.from_bytes(data=buf.getvalue(), mime_type="image/webp")
+
+    @staticmethod
+    def pil_list_to_webp_parts(pil_images: List[Image.Image], quality: int = 85) -> List[types.Part]:
+        """
+        Compress a list of PIL Images to WebP parts for upload.
+
+        Args:
+            pil_images: PIL Images to compress
+            quality: WebP quality (0-100)
+
+        Returns:
+            List of types.Part objects with WebP-encoded image data
+        """
+        return [ImageConverter.pil_to_webp_part(img, quality) for img in pil_images]
+
     @staticmethod
     def bytes_to_tensor(image_bytes: bytes):
         """
@@ -111,7 +208,18 @@ class ImageConverter:
         """
         from io import BytesIO
 
-        # Load image from bytes
+        # JPEG fast path: decode with libjpeg-turbo directly to a uint8
+        # array and normalize in place, skipping the PIL detour entirely
+        if _TURBO_JPEG is not None and image_bytes[:2] == b'\xff\xd8':
+            try:
+                import torch
+            except ImportError:
+                raise ImportError("torch is required for tensor conversion")
+
+            array = _TURBO_JPEG.decode(image_bytes, pixel_format=TJPF_RGB)
+            return torch.from_numpy(array).float().div_(255.0).unsqueeze(0)
+
+        # PNG/WebP (and installs without turbojpeg) keep the PIL path
         pil_image = Image.open(BytesIO(image_bytes))
 
         # Convert to tensor
@@ -1,8 +1,155 @@
 # ABOUTME: ComfyUI nodes for Google Gemini API integration
 # ABOUTME: Provides text generation, vision, chat, and configuration nodes
 
+import functools
+import logging
+
+# pybase64 provides a SIMD (AVX2) base64 decoder; multi-MB image payloads
+# decode several times faster than with the stdlib scalar path
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from PIL import Image
+
+try:
+    from google.genai import types as genai_types
+except ImportError:
+    genai_types = None
+
 from .gemini_api.client import GeminiClient
 from .gemini_api.utils import ImageConverter, SafetySettings
+from .prompt_compress import compress as _compress_prompt
+
+log = logging.getLogger("erpk.gemini")
+
+
+# Input specs shared verbatim by several nodes, hoisted so INPUT_TYPES
+# references them instead of re-allocating the same literals per class
+_CLIENT_INPUT = (
+    "GEMINI_API_CLIENT",
+    {"tooltip": "Gemini API client from Gemini API Config node"}
+)
+_COMPRESS_PROMPT_INPUT = (
+    "BOOLEAN",
+    {
+        "default": False,
+        "tooltip": "Strip filler phrases and redundant whitespace to reduce billed tokens"
+    }
+)
+_STREAM_INPUT = (
+    "BOOLEAN",
+    {
+        "default": True,
+        "tooltip": "Stream the response instead of waiting for full completion"
+    }
+)
+_API_KEY_INPUT = (
+    "STRING",
+    {
+        "default": "",
+        "tooltip": "Google API key (uses env/config if empty)"
+    }
+)
+
+# Image generation models offered by the image nodes
+_IMAGE_MODELS = {
+    "gemini-2.5-flash-image": "Gemini 2.5 Flash Image (Recommended)",
+    "gemini-2.5-flash-image-preview": "Gemini 2.5 Flash Image Preview (Experimental)",
+}
+
+# Optional tokenizer for the pre-flight budget estimate; the len//4
+# heuristic is accurate enough for sizing when tiktoken isn't installed
+try:
+    import tiktoken
+    _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _TIKTOKEN_ENCODING = None
+
+# All supported Gemini 2.x models accept ~1M input tokens; images bill
+# roughly 258 tokens per 768px tile
+_CONTEXT_WINDOW = 1_048_576
+_TOKENS_PER_IMAGE = 258
+_TOKEN_SAFETY_MARGIN = 1024
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap local token estimate for a prompt string."""
+    if _TIKTOKEN_ENCODING is not None:
+        return len(_TIKTOKEN_ENCODING.encode(text))
+    return len(text) // 4
+
+
+def _check_token_budget(prompt: str, max_tokens: int = 0, num_images: int = 0):
+    """
+    Reject prompts that cannot fit the model context before spending an
+    API round trip on a guaranteed server-side rejection.
+
+    Args:
+        prompt: Text prompt about to be sent
+        max_tokens: Requested output token budget
+        num_images: Number of attached images
+
+    Raises:
+        ValueError: If the estimated request exceeds the context window
+    """
+    estimated = _estimate_tokens(prompt) + _TOKENS_PER_IMAGE * num_images
+    if estimated + max_tokens + _TOKEN_SAFETY_MARGIN > _CONTEXT_WINDOW:
+        raise ValueError(
+            f"Prompt too large: ~{estimated} estimated input tokens plus "
+            f"{max_tokens} output tokens exceeds the {_CONTEXT_WINDOW}-token "
+            f"context window"
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _gen_config(max_output_tokens=None, temperature=None, aspect_ratio=None):
+    """
+    Build (or reuse) a GenerateContentConfig for a parameter tuple.
+
+    The configs are immutable once built, so interning them avoids
+    re-allocating identical objects on every execution of a looped
+    workflow.
+
+    Args:
+        max_output_tokens: Maximum tokens to generate (None = model default)
+        temperature: Sampling temperature (None = model default)
+        aspect_ratio: Image aspect ratio, or None for the model default
+
+    Returns:
+        Shared GenerateContentConfig instance
+    """
+    config = genai_types.GenerateContentConfig()
+    if max_output_tokens is not None:
+        config.max_output_tokens = max_output_tokens
+    if temperature is not None:
+        config.temperature = temperature
+    if aspect_ratio:
+        config.image_config = genai_types.ImageConfig(aspect_ratio=aspect_ratio)
+    return config
+
+
+def _downscale_images(pil_images, max_edge: int):
+    """
+    Downscale images so their longest edge fits within max_edge.
+
+    Gemini tiles images at 768px, so oversized uploads waste bandwidth and
+    billed tokens with negligible quality benefit. Oversized images are
+    replaced with resized copies; the originals (which may be shared via
+    the converter cache) are left untouched.
+
+    Args:
+        pil_images: List of PIL Images (oversized entries replaced in place)
+        max_edge: Maximum allowed edge length in pixels
+    """
+    for i, img in enumerate(pil_images):
+        if max(img.size) > max_edge:
+            original_size = img.size
+            img = img.copy()
+            img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            pil_images[i] = img
+            log.info(f"Downscaled image {original_size} -> {img.size}")
 
 
 class GeminiAPIConfig:
@@ -14,6 +161,7 @@ class GeminiAPIConfig:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         model_descriptions = "\n".join([f"{k}: {v}" for k, v in GeminiClient.MODELS.items()])
         return {
@@ -59,13 +207,13 @@ class GeminiAPIConfig:
                 model=model
             )
 
-            print(f"[Gemini] Client initialized with model: {model}")
+            log.info(f"Client initialized with model: {model}")
 
             return (client,)
 
         except Exception as e:
             error_msg = f"Failed to create Gemini client: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -81,13 +229,11 @@ class GeminiTextGeneration:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "client": (
-                    "GEMINI_API_CLIENT",
-                    {"tooltip": "Gemini API client from Gemini API Config node"}
-                ),
+                "client": _CLIENT_INPUT,
                 "prompt": (
                     "STRING",
                     {
@@ -118,6 +264,8 @@ class GeminiTextGeneration:
                         "tooltip": "Maximum length of response"
                     }
                 ),
+                "compress_prompt": _COMPRESS_PROMPT_INPUT,
+                "stream": _STREAM_INPUT,
             }
         }
 
@@ -131,7 +279,9 @@ class GeminiTextGeneration:
         client: GeminiClient,
         prompt: str,
         temperature: float = 0.7,
-        max_tokens: int = 8192
+        max_tokens: int = 8192,
+        compress_prompt: bool = False,
+        stream: bool = True
     ):
         """
         Generate text using Gemini.
@@ -141,6 +291,8 @@ class GeminiTextGeneration:
             prompt: User prompt
             temperature: Creativity level
             max_tokens: Max output tokens
+            compress_prompt: Run the rule-based prompt compression pass
+            stream: Use the streaming API for lower first-byte latency
 
         Returns:
             Tuple containing generated text
@@ -148,8 +300,14 @@ class GeminiTextGeneration:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        if compress_prompt:
+            prompt = _compress_prompt(prompt)
+
+        _check_token_budget(prompt, max_tokens)
+
         try:
-            response = client.generate_content(
+            generate = client.generate_content_stream if stream else client.generate_content
+            response = generate(
                 prompt=prompt.strip(),
                 max_tokens=max_tokens,
                 temperature=temperature
@@ -157,17 +315,17 @@ class GeminiTextGeneration:
 
             if response.get("blocked", False):
                 error_msg = f"Response blocked by safety filters. Reason: {response.get('finish_reason', 'UNKNOWN')}"
-                print(f"[Gemini] Warning: {error_msg}")
+                log.warning(error_msg)
                 raise ValueError(error_msg)
 
             text = response.get("text", "")
-            print(f"[Gemini] Text generated successfully ({len(text)} characters)")
+            log.info(f"Text generated successfully ({len(text)} characters)")
 
             return (text,)
 
         except Exception as e:
             error_msg = f"Failed to generate text: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -180,13 +338,11 @@ class GeminiChat:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "client": (
-                    "GEMINI_API_CLIENT",
-                    {"tooltip": "Gemini API client from Gemini API Config node"}
-                ),
+                "client": _CLIENT_INPUT,
                 "prompt": (
                     "STRING",
                     {
@@ -228,6 +384,8 @@ class GeminiChat:
                         "tooltip": "Maximum length of response"
                     }
                 ),
+                "compress_prompt": _COMPRESS_PROMPT_INPUT,
+                "stream": _STREAM_INPUT,
             }
         }
 
@@ -243,7 +401,9 @@ class GeminiChat:
         chat_session=None,
         reset_conversation: bool = False,
         temperature: float = 0.7,
-        max_tokens: int = 8192
+        max_tokens: int = 8192,
+        compress_prompt: bool = False,
+        stream: bool = True
     ):
         """
         Continue or start a conversation with Gemini.
@@ -255,6 +415,8 @@ class GeminiChat:
             reset_conversation: Start new conversation
             temperature: Creativity level
             max_tokens: Max output tokens
+            compress_prompt: Run the rule-based prompt compression pass
+            stream: Use the streaming API for lower first-byte latency
 
         Returns:
             Tuple containing (response text, chat session)
@@ -262,41 +424,42 @@ class GeminiChat:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        if compress_prompt:
+            prompt = _compress_prompt(prompt)
+
+        _check_token_budget(prompt, max_tokens)
+
         try:
             # Start new session or use existing
             if reset_conversation or chat_session is None:
-                # Update client config with temperature/max_tokens before starting chat
-                from google.genai import types
-                config = types.GenerateContentConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=temperature
-                )
-                # Temporarily store config and start chat
-                original_config = (client.system_instruction, client.safety_settings)
                 chat_session = client.start_chat()
-                print("[Gemini] Started new conversation")
+                log.info("Started new conversation")
             else:
-                print(f"[Gemini] Continuing conversation")
-
-            # Send message and get response
-            from google.genai import types
-            config = types.GenerateContentConfig(
-                max_output_tokens=max_tokens,
-                temperature=temperature
-            )
-            response = chat_session.send_message(
-                prompt.strip(),
-                config=config
-            )
-
-            text = response.text
-            print(f"[Gemini] Chat response generated ({len(text)} characters)")
+                log.info("Continuing conversation")
+
+            # Send message and get response (config is interned per
+            # parameter tuple, and no longer built twice on reset)
+            config = _gen_config(max_tokens, temperature)
+            if stream:
+                # Accumulate chunks via list + join to avoid O(n^2) concat
+                chunks = chat_session.send_message_stream(
+                    prompt.strip(),
+                    config=config
+                )
+                text = "".join(chunk.text or "" for chunk in chunks)
+            else:
+                response = chat_session.send_message(
+                    prompt.strip(),
+                    config=config
+                )
+                text = response.text
+            log.info(f"Chat response generated ({len(text)} characters)")
 
             return (text, chat_session)
 
         except Exception as e:
             error_msg = f"Failed to generate chat response: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -309,13 +472,11 @@ class GeminiVision:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "client": (
-                    "GEMINI_API_CLIENT",
-                    {"tooltip": "Gemini API client from Gemini API Config node"}
-                ),
+                "client": _CLIENT_INPUT,
                 "image": (
                     "IMAGE",
                     {"tooltip": "Image(s) to analyze (ComfyUI tensor)"}
@@ -350,6 +511,17 @@ class GeminiVision:
                         "tooltip": "Creativity level (lower=more factual)"
                     }
                 ),
+                "max_edge": (
+                    "INT",
+                    {
+                        "default": 1536,
+                        "min": 512,
+                        "max": 3072,
+                        "step": 128,
+                        "tooltip": "Downscale images so the longest edge fits this size before upload"
+                    }
+                ),
+                "compress_prompt": _COMPRESS_PROMPT_INPUT,
             }
         }
 
@@ -364,7 +536,9 @@ class GeminiVision:
         image,
         prompt: str,
         max_tokens: int = 8192,
-        temperature: float = 0.4
+        temperature: float = 0.4,
+        max_edge: int = 1536,
+        compress_prompt: bool = False
     ):
         """
         Analyze image(s) using Gemini's vision capabilities.
@@ -375,6 +549,8 @@ class GeminiVision:
             prompt: Question or instruction about images
             max_tokens: Max output tokens
             temperature: Creativity level
+            max_edge: Maximum edge length before upload (larger images are downscaled)
+            compress_prompt: Run the rule-based prompt compression pass
 
         Returns:
             Tuple containing analysis text
@@ -382,32 +558,44 @@ class GeminiVision:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        if compress_prompt:
+            prompt = _compress_prompt(prompt)
+
+        num_images = image.shape[0] if len(image.shape) == 4 else 1
+        _check_token_budget(prompt, max_tokens, num_images)
+
         try:
             # Convert tensor(s) to PIL images
             pil_images = ImageConverter.tensors_to_pil_list(image)
-            print(f"[Gemini] Analyzing {len(pil_images)} image(s)")
+            log.info(f"Analyzing {len(pil_images)} image(s)")
+
+            # Downscale oversized images to save bandwidth and billed tokens
+            _downscale_images(pil_images, max_edge)
+
+            # Pre-compress to WebP so the SDK doesn't upload lossless PNG
+            image_parts = ImageConverter.pil_list_to_webp_parts(pil_images)
 
             # Generate content with images
             response = client.generate_content(
                 prompt=prompt.strip(),
-                images=pil_images,
+                images=image_parts,
                 max_tokens=max_tokens,
                 temperature=temperature
             )
 
             if response.get("blocked", False):
                 error_msg = f"Response blocked by safety filters. Reason: {response.get('finish_reason', 'UNKNOWN')}"
-                print(f"[Gemini] Warning: {error_msg}")
+                log.warning(error_msg)
                 raise ValueError(error_msg)
 
             text = response.get("text", "")
-            print(f"[Gemini] Vision analysis completed ({len(text)} characters)")
+            log.info(f"Vision analysis completed ({len(text)} characters)")
 
             return (text,)
 
         except Exception as e:
             error_msg = f"Failed to analyze image: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -420,6 +608,7 @@ class GeminiSystemInstruction:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -459,15 +648,15 @@ class GeminiSystemInstruction:
 
             if instruction:
                 client.update_config(system_instruction=instruction)
-                print(f"[Gemini] System instruction set ({len(instruction)} characters)")
+                log.info(f"System instruction set ({len(instruction)} characters)")
             else:
-                print("[Gemini] Warning: Empty system instruction, skipping")
+                log.warning("Empty system instruction, skipping")
 
             return (client,)
 
         except Exception as e:
             error_msg = f"Failed to set system instruction: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -480,6 +669,7 @@ class GeminiSafetySettings:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         threshold_options = ["none", "low", "medium", "high"]
         return {
@@ -565,10 +755,10 @@ class GeminiSafetySettings:
                     sexually_explicit=sexually_explicit,
                     dangerous_content=dangerous_content
                 )
-                print(f"[Gemini] Custom safety settings configured")
+                log.info("Custom safety settings configured")
             else:
                 safety_settings = SafetySettings.get_preset(preset)
-                print(f"[Gemini] Safety preset '{preset}' configured")
+                log.info(f"Safety preset '{preset}' configured")
 
             # Update client with safety settings
             client.update_config(safety_settings=safety_settings)
@@ -577,7 +767,7 @@ class GeminiSafetySettings:
 
         except Exception as e:
             error_msg = f"Failed to configure safety settings: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -590,13 +780,8 @@ class GeminiImageGeneration:
     """
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
-        # Only include image generation models
-        image_models = {
-            "gemini-2.5-flash-image": "Gemini 2.5 Flash Image (Recommended)",
-            "gemini-2.5-flash-image-preview": "Gemini 2.5 Flash Image Preview (Experimental)",
-        }
-
         return {
             "required": {
                 "prompt": (
@@ -609,15 +794,9 @@ class GeminiImageGeneration:
                 ),
             },
             "optional": {
-                "api_key": (
-                    "STRING",
-                    {
-                        "default": "",
-                        "tooltip": "Google API key (uses env/config if empty)"
-                    }
-                ),
+                "api_key": _API_KEY_INPUT,
                 "model": (
-                    list(image_models.keys()),
+                    list(_IMAGE_MODELS.keys()),
                     {
                         "default": "gemini-2.5-flash-image",
                         "tooltip": "Image generation model"
@@ -640,6 +819,7 @@ class GeminiImageGeneration:
                         "tooltip": "Image aspect ratio (default uses model's default)"
                     }
                 ),
+                "compress_prompt": _COMPRESS_PROMPT_INPUT,
             }
         }
 
@@ -654,7 +834,8 @@ class GeminiImageGeneration:
         api_key: str = "",
         model: str = "gemini-2.5-flash-image",
         temperature: float = 1.0,
-        aspect_ratio: str = "default"
+        aspect_ratio: str = "default",
+        compress_prompt: bool = False
     ):
         """
         Generate an image using Gemini's image generation models.
@@ -665,6 +846,7 @@ class GeminiImageGeneration:
             model: Image generation model to use
             temperature: Creativity level
             aspect_ratio: Image aspect ratio (1:1, 9:16, 16:9, 4:3, 3:4, or default)
+            compress_prompt: Run the rule-based prompt compression pass
 
         Returns:
             Tuple containing generated image tensor
@@ -672,6 +854,11 @@ class GeminiImageGeneration:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        if compress_prompt:
+            prompt = _compress_prompt(prompt)
+
+        _check_token_budget(prompt)
+
         try:
             # Create a temporary client for image generation
             client = GeminiClient(
@@ -679,22 +866,18 @@ class GeminiImageGeneration:
                 model=model
             )
 
-            print(f"[Gemini] Generating image with model: {model}")
-            print(f"[Gemini] Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
+            log.info(f"Generating image with model: {model}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
             if aspect_ratio != "default":
-                print(f"[Gemini] Aspect ratio: {aspect_ratio}")
-
-            # Build generation config
-            from google.genai import types
+                log.info(f"Aspect ratio: {aspect_ratio}")
 
-            config = types.GenerateContentConfig(
+            # Build generation config (interned per parameter tuple)
+            config = _gen_config(
                 temperature=temperature,
+                aspect_ratio=aspect_ratio if aspect_ratio != "default" else None
             )
 
-            # Add aspect ratio if specified
-            if aspect_ratio != "default":
-                config.image_config = types.ImageConfig(aspect_ratio=aspect_ratio)
-
             # Generate content using NEW SDK
             response = client.client.models.generate_content(
                 model=client.model_name,
@@ -702,39 +885,37 @@ class GeminiImageGeneration:
                 config=config
             )
 
-            # Extract image from response
+            # Extract image from response: single scan, stop at first part
+            # that actually carries inline data
+            parts = response.candidates[0].content.parts or []
+            image_part = next(
+                (p for p in parts if getattr(p, 'inline_data', None) and p.inline_data.data),
+                None
+            )
+
             image_tensor = None
-            for part in response.candidates[0].content.parts:
-                if hasattr(part, 'inline_data') and part.inline_data is not None:
-                    image_data = part.inline_data.data
-
-                    # Check if data is empty
-                    if not image_data or (hasattr(image_data, '__len__') and len(image_data) == 0):
-                        continue
-
-                    # Convert bytes to tensor
-                    if isinstance(image_data, bytes):
-                        image_tensor = ImageConverter.bytes_to_tensor(image_data)
-                        print(f"[Gemini] Image generated successfully: {image_tensor.shape}")
-                        break
-                    elif isinstance(image_data, str):
-                        # Handle base64 string if needed
-                        import base64
-                        decoded_data = base64.b64decode(image_data)
-                        if len(decoded_data) > 0:
-                            image_tensor = ImageConverter.bytes_to_tensor(decoded_data)
-                            print(f"[Gemini] Image generated successfully: {image_tensor.shape}")
-                            break
+            if image_part is not None:
+                image_data = image_part.inline_data.data
+
+                # SDK delivers raw bytes in practice, so test that first;
+                # base64 strings are the rare fallback
+                if isinstance(image_data, (bytes, bytearray)):
+                    image_tensor = ImageConverter.bytes_to_tensor(bytes(image_data))
+                    log.info(f"Image generated successfully: {image_tensor.shape}")
+                elif isinstance(image_data, str):
+                    decoded_data = base64.b64decode(image_data, validate=False)
+                    if decoded_data:
+                        image_tensor = ImageConverter.bytes_to_tensor(decoded_data)
+                        log.info(f"Image generated successfully: {image_tensor.shape}")
 
             if image_tensor is None:
                 # Provide helpful error message based on what we found
                 error_parts = ["No image was generated."]
 
-                # Check if we got text instead
-                if response.candidates and response.candidates[0].content.parts:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            error_parts.append(f"Model returned text: {part.text[:100]}")
+                # Check if we got text instead (first text part only)
+                text = next((p.text for p in parts if getattr(p, 'text', None)), None)
+                if text:
+                    error_parts.append(f"Model returned text: {text[:100]}")
 
                 # Check finish reason
                 if response.candidates:
@@ -751,7 +932,7 @@ class GeminiImageGeneration:
 
         except Exception as e:
             error_msg = f"Failed to generate image: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
@@ -764,12 +945,10 @@ class GeminiImageEdit:
     """
 
     # Same image generation models as GeminiImageGeneration
-    image_models = {
-        "gemini-2.5-flash-image": "Gemini 2.5 Flash Image (Recommended)",
-        "gemini-2.5-flash-image-preview": "Gemini 2.5 Flash Image Preview (Experimental)",
-    }
+    image_models = _IMAGE_MODELS
 
     @classmethod
+    @functools.cache
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -787,13 +966,7 @@ class GeminiImageEdit:
                 ),
             },
             "optional": {
-                "api_key": (
-                    "STRING",
-                    {
-                        "default": "",
-                        "tooltip": "Google API key (uses env/config if empty)"
-                    }
-                ),
+                "api_key": _API_KEY_INPUT,
                 "model": (
                     list(cls.image_models.keys()),
                     {
@@ -818,6 +991,17 @@ class GeminiImageEdit:
                         "tooltip": "Image aspect ratio (default uses model's default)"
                     }
                 ),
+                "max_edge": (
+                    "INT",
+                    {
+                        "default": 1536,
+                        "min": 512,
+                        "max": 3072,
+                        "step": 128,
+                        "tooltip": "Downscale input images so the longest edge fits this size before upload"
+                    }
+                ),
+                "compress_prompt": _COMPRESS_PROMPT_INPUT,
             }
         }
 
@@ -833,7 +1017,9 @@ class GeminiImageEdit:
         api_key: str = "",
         model: str = "gemini-2.5-flash-image",
         temperature: float = 1.0,
-        aspect_ratio: str = "default"
+        aspect_ratio: str = "default",
+        max_edge: int = 1536,
+        compress_prompt: bool = False
     ):
         """
         Edit an image using Gemini's image generation models.
@@ -845,6 +1031,8 @@ class GeminiImageEdit:
             model: Image generation model to use
             temperature: Creativity level
             aspect_ratio: Image aspect ratio (1:1, 9:16, 16:9, 4:3, 3:4, or default)
+            max_edge: Maximum edge length before upload (larger images are downscaled)
+            compress_prompt: Run the rule-based prompt compression pass
 
         Returns:
             Tuple containing edited image tensor
@@ -852,6 +1040,12 @@ class GeminiImageEdit:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        if compress_prompt:
+            prompt = _compress_prompt(prompt)
+
+        num_images = image.shape[0] if len(image.shape) == 4 else 1
+        _check_token_budget(prompt, num_images=num_images)
+
         try:
             # Create a temporary client for image editing
             client = GeminiClient(
@@ -863,29 +1057,29 @@ class GeminiImageEdit:
             pil_images = ImageConverter.tensors_to_pil_list(image)
             num_images = len(pil_images)
 
-            print(f"[Gemini] Editing image with model: {model}")
-            print(f"[Gemini] Number of input images: {num_images}")
-            print(f"[Gemini] Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
+            log.info(f"Editing image with model: {model}")
+            log.info(f"Number of input images: {num_images}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
             if aspect_ratio != "default":
-                print(f"[Gemini] Aspect ratio: {aspect_ratio}")
+                log.info(f"Aspect ratio: {aspect_ratio}")
 
             # Warn if using more than 3 images (API works best with 1-3)
             if num_images > 3:
-                print(f"[Gemini] Warning: Using {num_images} images. API works best with 1-3 images.")
+                log.warning(f"Using {num_images} images. API works best with 1-3 images.")
 
-            # Build generation config
-            from google.genai import types
+            # Downscale oversized images to save bandwidth and billed tokens
+            _downscale_images(pil_images, max_edge)
 
-            config = types.GenerateContentConfig(
+            # Build generation config (interned per parameter tuple)
+            config = _gen_config(
                 temperature=temperature,
+                aspect_ratio=aspect_ratio if aspect_ratio != "default" else None
             )
 
-            # Add aspect ratio if specified
-            if aspect_ratio != "default":
-                config.image_config = types.ImageConfig(aspect_ratio=aspect_ratio)
-
             # Build content list: images first, then prompt
-            contents = pil_images + [prompt.strip()]
+            # Images are pre-compressed to WebP to shrink the upload payload
+            contents = ImageConverter.pil_list_to_webp_parts(pil_images) + [prompt.strip()]
 
             # Generate content using NEW SDK
             response = client.client.models.generate_content(
@@ -894,39 +1088,42 @@ class GeminiImageEdit:
                 config=config
             )
 
-            # Extract image from response
+            # Extract image from response in one pass: grab the first
+            # non-empty inline blob and collect text snippets for the
+            # error message as we go, instead of re-walking the parts
             image_tensor = None
-            for part in response.candidates[0].content.parts:
-                if hasattr(part, 'inline_data') and part.inline_data is not None:
-                    image_data = part.inline_data.data
-
-                    # Check if data is empty
-                    if not image_data or (hasattr(image_data, '__len__') and len(image_data) == 0):
-                        continue
-
-                    # Convert bytes to tensor
-                    if isinstance(image_data, bytes):
-                        image_tensor = ImageConverter.bytes_to_tensor(image_data)
-                        print(f"[Gemini] Image edited successfully: {image_tensor.shape}")
+            text_snippets = []
+            parts = response.candidates[0].content.parts or []
+            for part in parts:
+                inline_data = getattr(part, 'inline_data', None)
+                image_data = inline_data.data if inline_data is not None else None
+
+                if not image_data:
+                    text = getattr(part, 'text', None)
+                    if text:
+                        text_snippets.append(text[:100])
+                    continue
+
+                # Convert bytes to tensor (bytes first: the SDK's
+                # common case; base64 strings are the rare fallback)
+                if isinstance(image_data, (bytes, bytearray)):
+                    image_tensor = ImageConverter.bytes_to_tensor(bytes(image_data))
+                    log.info(f"Image edited successfully: {image_tensor.shape}")
+                    break
+                elif isinstance(image_data, str):
+                    decoded_data = base64.b64decode(image_data, validate=False)
+                    if decoded_data:
+                        image_tensor = ImageConverter.bytes_to_tensor(decoded_data)
+                        log.info(f"Image edited successfully: {image_tensor.shape}")
                         break
-                    elif isinstance(image_data, str):
-                        # Handle base64 string if needed
-                        import base64
-                        decoded_data = base64.b64decode(image_data)
-                        if len(decoded_data) > 0:
-                            image_tensor = ImageConverter.bytes_to_tensor(decoded_data)
-                            print(f"[Gemini] Image edited successfully: {image_tensor.shape}")
-                            break
 
             if image_tensor is None:
                 # Provide helpful error message
                 error_parts = ["No image was generated."]
 
-                # Check if we got text instead
-                if response.candidates and response.candidates[0].content.parts:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            error_parts.append(f"Model returned text: {part.text[:100]}")
+                # Text collected during the scan above
+                for text in text_snippets:
+                    error_parts.append(f"Model returned text: {text}")
 
                 # Check finish reason
                 if response.candidates:
@@ -943,7 +1140,7 @@ class GeminiImageEdit:
 
         except Exception as e:
             error_msg = f"Failed to edit image: {str(e)}"
-            print(f"[Gemini] Error: {error_msg}")
+            log.error(error_msg)
             raise ValueError(error_msg)
 
 
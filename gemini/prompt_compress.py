@@ -0,0 +1,73 @@
+# ABOUTME: Rule-based prompt compression for Gemini nodes
+# ABOUTME: Strips filler phrases and redundant whitespace to cut billed tokens
+
+import re
+from typing import List, Tuple
+
+# Regions that must never be rewritten: fenced code blocks and {variables}
+_PROTECTED_PATTERN = re.compile(r"```.*?```|\{[^{}\n]*\}", re.DOTALL)
+
+# Deterministic rewrite passes applied in order. Each pass is a compiled
+# pattern plus its replacement; patterns are case-insensitive where the
+# phrasing varies with capitalization.
+_PASSES: List[Tuple[re.Pattern, str]] = [
+    # Polite preambles that carry no instruction content
+    (re.compile(r"^(?:please\s+)?(?:could|can|would)\s+you\s+(?:please\s+)?", re.IGNORECASE), ""),
+    (re.compile(r"^i(?:'d| would)\s+like\s+(?:you\s+)?to\s+", re.IGNORECASE), ""),
+    (re.compile(r"^i\s+want\s+you\s+to\s+", re.IGNORECASE), ""),
+    # Filler phrases
+    (re.compile(r"\bplease\s+could\s+you\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bin\s+order\s+to\b", re.IGNORECASE), "to"),
+    (re.compile(r"\bit\s+is\s+important\s+to\s+note\s+that\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bkeep\s+in\s+mind\s+that\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bas\s+a\s+matter\s+of\s+fact\b,?\s*", re.IGNORECASE), ""),
+    (re.compile(r"\bdue\s+to\s+the\s+fact\s+that\b", re.IGNORECASE), "because"),
+    (re.compile(r"\bat\s+this\s+point\s+in\s+time\b", re.IGNORECASE), "now"),
+    (re.compile(r"\bmake\s+sure\s+to\b", re.IGNORECASE), ""),
+    (re.compile(r"\bbasically\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bvery\s+very\b", re.IGNORECASE), "very"),
+    # Redundant duplicated words ("the the", "a a")
+    (re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE), r"\1"),
+    # Whitespace collapse: runs of spaces/tabs, and 3+ newlines down to 2
+    (re.compile(r"[ \t]{2,}"), " "),
+    (re.compile(r"\n{3,}"), "\n\n"),
+    (re.compile(r"[ \t]+(?=\n)"), ""),
+]
+
+
+def compress(prompt: str) -> str:
+    """
+    Compress a prompt by stripping filler phrases and redundant whitespace.
+
+    Code blocks (```...```) and {variable} placeholders are protected and
+    restored verbatim after the rewrite passes run.
+
+    Args:
+        prompt: Raw user prompt
+
+    Returns:
+        Compressed prompt (never empty if the input was non-empty)
+    """
+    if not prompt:
+        return prompt
+
+    # Pull out protected regions so the passes can't touch them
+    protected = []
+
+    def _stash(match):
+        protected.append(match.group(0))
+        return f"\x00{len(protected) - 1}\x00"
+
+    text = _PROTECTED_PATTERN.sub(_stash, prompt)
+
+    for pattern, repl in _PASSES:
+        text = pattern.sub(repl, text)
+
+    # Restore protected regions
+    for i, region in enumerate(protected):
+        text = text.replace(f"\x00{i}\x00", region)
+
+    text = text.strip()
+
+    # Never return an empty prompt if compression removed everything
+    return text if text else prompt.strip()
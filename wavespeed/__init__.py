@@ -6,13 +6,7 @@ including ByteDance's Seedream V4 and Qwen Image models for text-to-image
 and image editing capabilities.
 """
 
-import os
-import sys
-
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+import importlib
 
 # Import node mappings from core nodes module
 from .nodes import (
@@ -28,64 +22,27 @@ NODE_DISPLAY_NAME_MAPPINGS = {}
 NODE_CLASS_MAPPINGS.update(CORE_NODE_CLASS_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(CORE_NODE_DISPLAY_NAME_MAPPINGS)
 
-# Import and register individual model nodes
-try:
-    # Seedream V4 nodes
-    from .seedream_v4 import NODE_CLASS_MAPPINGS as SEEDREAM_V4_MAPPINGS
-    from .seedream_v4 import NODE_DISPLAY_NAME_MAPPINGS as SEEDREAM_V4_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(SEEDREAM_V4_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(SEEDREAM_V4_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Seedream V4 node: {e}")
-
-try:
-    from .seedream_v4_edit import NODE_CLASS_MAPPINGS as SEEDREAM_V4_EDIT_MAPPINGS
-    from .seedream_v4_edit import NODE_DISPLAY_NAME_MAPPINGS as SEEDREAM_V4_EDIT_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(SEEDREAM_V4_EDIT_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(SEEDREAM_V4_EDIT_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Seedream V4 Edit node: {e}")
-
-try:
-    from .seedream_v4_sequential import NODE_CLASS_MAPPINGS as SEEDREAM_V4_SEQ_MAPPINGS
-    from .seedream_v4_sequential import NODE_DISPLAY_NAME_MAPPINGS as SEEDREAM_V4_SEQ_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(SEEDREAM_V4_SEQ_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(SEEDREAM_V4_SEQ_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Seedream V4 Sequential node: {e}")
-
-try:
-    from .seedream_v4_edit_sequential import NODE_CLASS_MAPPINGS as SEEDREAM_V4_EDIT_SEQ_MAPPINGS
-    from .seedream_v4_edit_sequential import NODE_DISPLAY_NAME_MAPPINGS as SEEDREAM_V4_EDIT_SEQ_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(SEEDREAM_V4_EDIT_SEQ_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(SEEDREAM_V4_EDIT_SEQ_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Seedream V4 Edit Sequential node: {e}")
-
-# Qwen Image nodes
-try:
-    from .qwen_image_text_to_image import NODE_CLASS_MAPPINGS as QWEN_T2I_MAPPINGS
-    from .qwen_image_text_to_image import NODE_DISPLAY_NAME_MAPPINGS as QWEN_T2I_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(QWEN_T2I_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(QWEN_T2I_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Qwen Image Text-to-Image node: {e}")
-
-try:
-    from .qwen_image_edit import NODE_CLASS_MAPPINGS as QWEN_EDIT_MAPPINGS
-    from .qwen_image_edit import NODE_DISPLAY_NAME_MAPPINGS as QWEN_EDIT_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(QWEN_EDIT_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(QWEN_EDIT_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Qwen Image Edit node: {e}")
-
-try:
-    from .qwen_image_edit_plus import NODE_CLASS_MAPPINGS as QWEN_EDIT_PLUS_MAPPINGS
-    from .qwen_image_edit_plus import NODE_DISPLAY_NAME_MAPPINGS as QWEN_EDIT_PLUS_DISPLAY_MAPPINGS
-    NODE_CLASS_MAPPINGS.update(QWEN_EDIT_PLUS_MAPPINGS)
-    NODE_DISPLAY_NAME_MAPPINGS.update(QWEN_EDIT_PLUS_DISPLAY_MAPPINGS)
-except ImportError as e:
-    print(f"[WaveSpeed] Warning: Could not load Qwen Image Edit Plus node: {e}")
+# Model node submodules and their human-readable names. Loading through a
+# single loop keeps each module's failure isolated (a broken optional
+# module only skips its own nodes) and imports each submodule exactly
+# once instead of two from-imports per module.
+_NODE_MODULES = [
+    ("seedream_v4", "Seedream V4"),
+    ("seedream_v4_edit", "Seedream V4 Edit"),
+    ("seedream_v4_sequential", "Seedream V4 Sequential"),
+    ("seedream_v4_edit_sequential", "Seedream V4 Edit Sequential"),
+    ("qwen_image_text_to_image", "Qwen Image Text-to-Image"),
+    ("qwen_image_edit", "Qwen Image Edit"),
+    ("qwen_image_edit_plus", "Qwen Image Edit Plus"),
+]
+
+for _module_name, _label in _NODE_MODULES:
+    try:
+        _module = importlib.import_module(f".{_module_name}", __name__)
+        NODE_CLASS_MAPPINGS.update(_module.NODE_CLASS_MAPPINGS)
+        NODE_DISPLAY_NAME_MAPPINGS.update(_module.NODE_DISPLAY_NAME_MAPPINGS)
+    except ImportError as e:
+        print(f"[WaveSpeed] Warning: Could not load {_label} node: {e}")
 
 # Print loaded nodes for debugging
 print(f"[WaveSpeed] Loaded {len(NODE_CLASS_MAPPINGS)} nodes:")
@@ -9,9 +9,14 @@ This module provides the essential nodes for WaveSpeed AI integration:
 
 import os
 import time
+import shutil
+import logging
 import requests
 import configparser
+from urllib.parse import urlparse
 from typing import Tuple, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ComfyUI imports
 try:
@@ -28,28 +33,62 @@ except ImportError:
             filename = f"{prefix}_{int(time.time())}"
             return directory, filename, 0, None, None
 
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.client import get_client
 from .wavespeed_api.utils import tensor2images
 
+# Module logger; silent by default so threaded uploads don't serialize on
+# the stdout lock. Enable via standard logging config.
+log = logging.getLogger("erpk.wavespeed")
+log.addHandler(logging.NullHandler())
+
+# Shared download session with keep-alive pooling and automatic retries,
+# so repeated preview/save calls reuse warm TLS connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
 # Configuration handling
 try:
     current_dir = os.path.dirname(os.path.abspath(__file__))
     temp_dir = os.path.join(current_dir, '.temp')
-    if not os.path.exists(temp_dir):
-        os.makedirs(temp_dir)
+    os.makedirs(temp_dir, exist_ok=True)
 
     config_path = os.path.join(current_dir, 'config.ini')
     config = configparser.ConfigParser()
 
-    if not os.path.exists(config_path):
-        config['API'] = {'WAVESPEED_API_KEY': ''}
-        with open(config_path, 'w') as config_file:
+    # Atomically create the default config on first run; 'x' fails if the
+    # file already exists, replacing the racy exists()-then-write pattern
+    try:
+        with open(config_path, 'x') as config_file:
+            config['API'] = {'WAVESPEED_API_KEY': ''}
             config.write(config_file)
+    except FileExistsError:
+        pass
 
     config.read(config_path)
+
+    # Resolve the config-file key once at import; create_client reads the
+    # cached value instead of re-walking the parsed config per execution
+    _CONFIG_KEY = (config.get('API', 'WAVESPEED_API_KEY', fallback='') or '').strip()
 except Exception as e:
-    print(f"[WaveSpeed] Error reading or creating config file: {e}")
+    log.error(f"Error reading or creating config file: {e}")
     config = None
+    _CONFIG_KEY = ''
+
+_NO_KEY_MSG = (
+    "No API key found. Please provide via:\n"
+    "  1. Node input parameter\n"
+    "  2. WAVESPEED_API_KEY environment variable\n"
+    "  3. config.ini file"
+)
+
+# Recognized media extensions for saved downloads; anything else falls
+# back to the per-node default
+_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.webm', '.mkv'})
+_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.flac', '.ogg', '.m4a'})
 
 
 class WaveSpeedAIAPIClient:
@@ -63,20 +102,24 @@ class WaveSpeedAIAPIClient:
     def __init__(self):
         pass
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "api_key": (
+                "STRING",
+                {
+                    "multiline": False,
+                    "default": "",
+                    "tooltip": "WaveSpeed AI API key. If empty, checks WAVESPEED_API_KEY environment variable, then config.ini"
+                }
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
-        return {
-            "required": {
-                "api_key": (
-                    "STRING",
-                    {
-                        "multiline": False,
-                        "default": "",
-                        "tooltip": "WaveSpeed AI API key. If empty, checks WAVESPEED_API_KEY environment variable, then config.ini"
-                    }
-                ),
-            },
-        }
+        return cls._INPUT_TYPES
 
     RETURN_TYPES = ("WAVESPEED_AI_API_CLIENT",)
     RETURN_NAMES = ("client",)
@@ -101,59 +144,22 @@ class WaveSpeedAIAPIClient:
         Raises:
             ValueError: If no API key is found in any source
         """
-        wavespeed_api_key = ""
-
         # Priority 1: Direct input (highest priority)
-        if api_key and api_key.strip():
-            wavespeed_api_key = api_key.strip()
-            print("[WaveSpeed] Using API key from node input")
+        wavespeed_api_key = (api_key or "").strip()
+        if wavespeed_api_key:
+            log.info("Using API key from node input")
 
         # Priority 2 & 3: Environment variable, then config file
         else:
-            # Try environment variable
-            env_key = os.getenv("WAVESPEED_API_KEY", "").strip()
-            if env_key:
-                wavespeed_api_key = env_key
-                print("[WaveSpeed] Using API key from environment variable WAVESPEED_API_KEY")
-
-            # Fall back to config file
-            elif config:
-                try:
-                    config_key = config['API']['WAVESPEED_API_KEY'].strip()
-                    if config_key:
-                        wavespeed_api_key = config_key
-                        print("[WaveSpeed] Using API key from config.ini")
-                    else:
-                        raise ValueError(
-                            "No API key found. Please provide via:\n"
-                            "  1. Node input parameter\n"
-                            "  2. WAVESPEED_API_KEY environment variable\n"
-                            "  3. config.ini file"
-                        )
-                except KeyError:
-                    raise ValueError(
-                        "No API key found. Please provide via:\n"
-                        "  1. Node input parameter\n"
-                        "  2. WAVESPEED_API_KEY environment variable\n"
-                        "  3. config.ini file"
-                    )
-
-            # No source available
-            else:
-                raise ValueError(
-                    "No API key found. Please provide via:\n"
-                    "  1. Node input parameter\n"
-                    "  2. WAVESPEED_API_KEY environment variable\n"
-                    "  3. config.ini file"
-                )
+            wavespeed_api_key = os.getenv("WAVESPEED_API_KEY", "").strip()
+            if wavespeed_api_key:
+                log.info("Using API key from environment variable WAVESPEED_API_KEY")
+            elif _CONFIG_KEY:
+                wavespeed_api_key = _CONFIG_KEY
+                log.info("Using API key from config.ini")
 
         if not wavespeed_api_key:
-            raise ValueError(
-                "No API key found. Please provide via:\n"
-                "  1. Node input parameter\n"
-                "  2. WAVESPEED_API_KEY environment variable\n"
-                "  3. config.ini file"
-            )
+            raise ValueError(_NO_KEY_MSG)
 
         # Return client configuration
         return ({"api_key": wavespeed_api_key},)
@@ -166,26 +172,30 @@ class PreviewVideo:
     This node allows previewing and saving videos generated by WaveSpeed AI.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "video_url": (
+                "STRING",
+                {
+                    "forceInput": False,
+                    "tooltip": "URL of the video to preview and save"
+                }
+            ),
+            "save_file_prefix": (
+                "STRING",
+                {
+                    "default": "wavespeed_video",
+                    "tooltip": "Prefix for the saved video file"
+                }
+            ),
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
-        return {
-            "required": {
-                "video_url": (
-                    "STRING",
-                    {
-                        "forceInput": False,
-                        "tooltip": "URL of the video to preview and save"
-                    }
-                ),
-                "save_file_prefix": (
-                    "STRING",
-                    {
-                        "default": "wavespeed_video",
-                        "tooltip": "Prefix for the saved video file"
-                    }
-                ),
-            }
-        }
+        return cls._INPUT_TYPES
 
     OUTPUT_NODE = True
     FUNCTION = "run"
@@ -211,17 +221,10 @@ class PreviewVideo:
         if not video_url:
             raise ValueError("No video URL provided")
 
-        # Download video
-        try:
-            response = requests.get(video_url, timeout=60)
-            response.raise_for_status()
-            video_data = response.content
-        except requests.RequestException as e:
-            raise RuntimeError(f"Error downloading video: {e}")
-
-        # Determine file extension
-        file_extension = os.path.splitext(video_url)[-1].lower()
-        if not file_extension or file_extension == '.' or len(file_extension) > 5:
+        # Determine file extension from the URL path (ignoring any query
+        # string, which previously broke detection for ?token=... URLs)
+        file_extension = os.path.splitext(urlparse(video_url).path)[-1].lower()
+        if file_extension not in _VIDEO_EXTS:
             file_extension = '.mp4'
 
         # Save video to output directory
@@ -229,10 +232,26 @@ class PreviewVideo:
         filename = f"{save_file_prefix}_{int(time.time())}{file_extension}"
         file_path = os.path.join(output_dir, filename)
 
-        with open(file_path, "wb") as f:
-            f.write(video_data)
+        # Stream the download straight to disk: no full-body buffer, and
+        # network receive overlaps the file write. Write to a .part file
+        # and rename on success so a mid-body failure never leaves a
+        # truncated video at the final path
+        part_path = file_path + ".part"
+        try:
+            with _SESSION.get(video_url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(part_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+            os.replace(part_path, file_path)
+        except requests.RequestException as e:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            raise RuntimeError(f"Error downloading video: {e}")
 
-        print(f"[WaveSpeed] Video saved to: {file_path}")
+        log.info(f"Video saved to: {file_path}")
 
         # Return UI data for ComfyUI preview
         return {
@@ -248,26 +267,30 @@ class SaveAudio:
     This node allows saving audio files generated by WaveSpeed AI.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "audio_url": (
+                "STRING",
+                {
+                    "forceInput": False,
+                    "tooltip": "URL of the audio to download and save"
+                }
+            ),
+            "save_file_prefix": (
+                "STRING",
+                {
+                    "default": "wavespeed_audio",
+                    "tooltip": "Prefix for the saved audio file"
+                }
+            ),
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
-        return {
-            "required": {
-                "audio_url": (
-                    "STRING",
-                    {
-                        "forceInput": False,
-                        "tooltip": "URL of the audio to download and save"
-                    }
-                ),
-                "save_file_prefix": (
-                    "STRING",
-                    {
-                        "default": "wavespeed_audio",
-                        "tooltip": "Prefix for the saved audio file"
-                    }
-                ),
-            }
-        }
+        return cls._INPUT_TYPES
 
     OUTPUT_NODE = True
     FUNCTION = "run"
@@ -293,17 +316,10 @@ class SaveAudio:
         if not audio_url:
             raise ValueError("No audio URL provided")
 
-        # Download audio
-        try:
-            response = requests.get(audio_url, timeout=60)
-            response.raise_for_status()
-            audio_data = response.content
-        except requests.RequestException as e:
-            raise RuntimeError(f"Error downloading audio: {e}")
-
-        # Determine file extension
-        file_extension = os.path.splitext(audio_url)[-1].lower()
-        if not file_extension or file_extension == '.' or len(file_extension) > 5:
+        # Determine file extension from the URL path (ignoring any query
+        # string, which previously broke detection for ?token=... URLs)
+        file_extension = os.path.splitext(urlparse(audio_url).path)[-1].lower()
+        if file_extension not in _AUDIO_EXTS:
             file_extension = '.mp3'
 
         # Save audio to output directory
@@ -315,10 +331,26 @@ class SaveAudio:
         file = f"{filename}_{counter:05d}{file_extension}"
         file_path = os.path.join(full_output_folder, file)
 
-        with open(file_path, "wb") as f:
-            f.write(audio_data)
+        # Stream the download straight to disk instead of buffering the
+        # whole body in memory first. Write to a .part file and rename on
+        # success so a mid-body failure never leaves a truncated audio
+        # file at the final path
+        part_path = file_path + ".part"
+        try:
+            with _SESSION.get(audio_url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(part_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+            os.replace(part_path, file_path)
+        except requests.RequestException as e:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            raise RuntimeError(f"Error downloading audio: {e}")
 
-        print(f"[WaveSpeed] Audio saved to: {file_path}")
+        log.info(f"Audio saved to: {file_path}")
 
         return (file_path,)
 
@@ -331,14 +363,18 @@ class UploadImage:
     Note: Uploaded URLs expire after a short time.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "image": ("IMAGE",)
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "image": ("IMAGE",)
-            }
-        }
+        return cls._INPUT_TYPES
 
     DESCRIPTION = "Upload an image to WaveSpeed AI API. The URL expires after a short time."
     RETURN_TYPES = ("STRING", "STRING",)
@@ -359,14 +395,14 @@ class UploadImage:
         """
         # Convert tensor to PIL images
         images = tensor2images(image)
-        image_urls = []
-
-        # Create client and upload each image
-        real_client = WaveSpeedClient(api_key=client["api_key"])
-        for img in images:
-            image_url = real_client.upload_file(img)
-            image_urls.append(image_url)
-            print(f"[WaveSpeed] Image uploaded: {image_url}")
+
+        # The client uploads concurrently; overlapping the pure network
+        # I/O cuts batch wall time to roughly the slowest single upload,
+        # and the returned URLs keep input order
+        real_client = get_client(client["api_key"])
+        image_urls = real_client.upload_files(images)
+        for image_url in image_urls:
+            log.info(f"Image uploaded: {image_url}")
 
         # Return first URL and list of all URLs
         return (
@@ -1,5 +1,12 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.utils import (
+    ensure_prompt,
+    fmt_size,
+    imageurl2tensor,
+    result_cache_get,
+    result_cache_key,
+    result_cache_put,
+)
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.qwen_image_edit import QwenImageEdit
 
 
@@ -12,81 +19,85 @@ class QwenImageEditNode:
     plus bilingual (Chinese and English) text editing capabilities.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the desired image modifications (Chinese or English)",
+                },
+            ),
+            "image": (
+                "STRING",
+                {
+                    "tooltip": "The image to edit (URL or path)",
+                },
+            ),
+        },
+        "optional": {
+            "width": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (256 to 1536)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (256 to 1536)",
+                },
+            ),
+            "seed": (
+                "INT",
+                {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "tooltip": "Random seed for reproducibility (-1 for random)",
+                },
+            ),
+            "output_format": (
+                ["jpeg", "png", "webp"],
+                {
+                    "default": "jpeg",
+                    "tooltip": "Output image format",
+                },
+            ),
+            "enable_sync_mode": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Wait for completion before returning response",
+                },
+            ),
+            "enable_base64_output": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Return BASE64-encoded output instead of URL",
+                },
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description of the desired image modifications (Chinese or English)",
-                    },
-                ),
-                "image": (
-                    "STRING",
-                    {
-                        "tooltip": "The image to edit (URL or path)",
-                    },
-                ),
-            },
-            "optional": {
-                "width": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (256 to 1536)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (256 to 1536)",
-                    },
-                ),
-                "seed": (
-                    "INT",
-                    {
-                        "default": -1,
-                        "min": -1,
-                        "max": 2147483647,
-                        "tooltip": "Random seed for reproducibility (-1 for random)",
-                    },
-                ),
-                "output_format": (
-                    ["jpeg", "png", "webp"],
-                    {
-                        "default": "jpeg",
-                        "tooltip": "Output image format",
-                    },
-                ),
-                "enable_sync_mode": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Wait for completion before returning response",
-                    },
-                ),
-                "enable_base64_output": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Return BASE64-encoded output instead of URL",
-                    },
-                ),
-            },
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("image",)
@@ -106,13 +117,23 @@ class QwenImageEditNode:
         enable_sync_mode=False,
         enable_base64_output=False,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
-        if image is None or image == "":
+        if not image:
             raise ValueError("Image must be provided")
 
-        size = f"{width}*{height}" if width and height else None
+        size = fmt_size(width, height) if width and height else None
+
+        # Identical seeded requests are deterministic, so serve repeats
+        # from the result cache without a new generation
+        cache_key = None
+        if seed != -1:
+            cache_key = result_cache_key(
+                "qwen-image-edit", prompt, image, size, seed, output_format
+            )
+            cached = result_cache_get(cache_key)
+            if cached is not None:
+                return (cached,)
 
         request = QwenImageEdit(
             prompt=prompt,
@@ -124,8 +145,8 @@ class QwenImageEditNode:
             enable_base64_output=enable_base64_output,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
@@ -133,6 +154,8 @@ class QwenImageEditNode:
             raise ValueError("No image URLs in the generated result")
 
         images = imageurl2tensor(image_urls)
+        if cache_key is not None:
+            result_cache_put(cache_key, images)
         return (images,)
 
 
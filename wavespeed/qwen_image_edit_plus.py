@@ -1,5 +1,14 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+import itertools
+
+from .wavespeed_api.utils import (
+    ensure_prompt,
+    fmt_size,
+    imageurl2tensor,
+    result_cache_get,
+    result_cache_key,
+    result_cache_put,
+)
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.qwen_image_edit_plus import QwenImageEditPlus
 
 
@@ -11,81 +20,85 @@ class QwenImageEditPlusNode:
     Accepts up to 3 reference images and supports bilingual (Chinese and English) text prompts.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the desired image modifications (Chinese or English)",
+                },
+            ),
+            "images": (
+                "STRING",
+                {
+                    "tooltip": "Reference images to edit. Maximum of 3 images can be provided (comma-separated URLs or paths)",
+                },
+            ),
+        },
+        "optional": {
+            "width": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (256 to 1536)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (256 to 1536)",
+                },
+            ),
+            "seed": (
+                "INT",
+                {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "tooltip": "Random seed for reproducibility (-1 for random)",
+                },
+            ),
+            "output_format": (
+                ["jpeg", "png", "webp"],
+                {
+                    "default": "jpeg",
+                    "tooltip": "Output image format",
+                },
+            ),
+            "enable_sync_mode": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Wait for completion before returning response",
+                },
+            ),
+            "enable_base64_output": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Return BASE64-encoded output instead of URL",
+                },
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description of the desired image modifications (Chinese or English)",
-                    },
-                ),
-                "images": (
-                    "STRING",
-                    {
-                        "tooltip": "Reference images to edit. Maximum of 3 images can be provided (comma-separated URLs or paths)",
-                    },
-                ),
-            },
-            "optional": {
-                "width": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (256 to 1536)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (256 to 1536)",
-                    },
-                ),
-                "seed": (
-                    "INT",
-                    {
-                        "default": -1,
-                        "min": -1,
-                        "max": 2147483647,
-                        "tooltip": "Random seed for reproducibility (-1 for random)",
-                    },
-                ),
-                "output_format": (
-                    ["jpeg", "png", "webp"],
-                    {
-                        "default": "jpeg",
-                        "tooltip": "Output image format",
-                    },
-                ),
-                "enable_sync_mode": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Wait for completion before returning response",
-                    },
-                ),
-                "enable_base64_output": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Return BASE64-encoded output instead of URL",
-                    },
-                ),
-            },
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("image",)
@@ -105,15 +118,18 @@ class QwenImageEditPlusNode:
         enable_sync_mode=False,
         enable_base64_output=False,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
-        if images is None or images == "":
+        if not images:
             raise ValueError("Images must be provided")
 
-        # Parse images input - support comma-separated URLs or array
+        # Parse images input - support comma-separated URLs or array.
+        # Strip lazily and stop after 4 entries: that is enough to detect
+        # the over-limit case without materializing a huge malformed list.
         if isinstance(images, str):
-            images_list = [img.strip() for img in images.split(",") if img.strip()]
+            images_list = list(itertools.islice(
+                (s for s in (img.strip() for img in images.split(",")) if s), 4
+            ))
         else:
             images_list = images
 
@@ -123,7 +139,18 @@ class QwenImageEditPlusNode:
 
         images_param = images_list[:3]
 
-        size = f"{width}*{height}" if width and height else None
+        size = fmt_size(width, height) if width and height else None
+
+        # Identical seeded requests are deterministic, so serve repeats
+        # from the result cache without a new generation
+        cache_key = None
+        if seed != -1:
+            cache_key = result_cache_key(
+                "qwen-image-edit-plus", prompt, tuple(images_param), size, seed, output_format
+            )
+            cached = result_cache_get(cache_key)
+            if cached is not None:
+                return (cached,)
 
         request = QwenImageEditPlus(
             prompt=prompt,
@@ -135,8 +162,8 @@ class QwenImageEditPlusNode:
             enable_base64_output=enable_base64_output,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
@@ -144,6 +171,8 @@ class QwenImageEditPlusNode:
             raise ValueError("No image URLs in the generated result")
 
         images = imageurl2tensor(image_urls)
+        if cache_key is not None:
+            result_cache_put(cache_key, images)
         return (images,)
 
 
@@ -1,5 +1,5 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.utils import ensure_prompt, fmt_size, imageurl2tensor
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.qwen_image_text_to_image import QwenImageTextToImage
 
 
@@ -11,75 +11,79 @@ class QwenImageTextToImageNode:
     Supports bilingual (Chinese and English) prompts.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the image to generate (Chinese or English)",
+                },
+            ),
+        },
+        "optional": {
+            "width": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (256 to 1536)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 256,
+                    "max": 1536,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (256 to 1536)",
+                },
+            ),
+            "seed": (
+                "INT",
+                {
+                    "default": -1,
+                    "min": -1,
+                    "max": 2147483647,
+                    "tooltip": "Random seed for reproducibility (-1 for random)",
+                },
+            ),
+            "output_format": (
+                ["jpeg", "png", "webp"],
+                {
+                    "default": "jpeg",
+                    "tooltip": "Output image format",
+                },
+            ),
+            "enable_sync_mode": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Wait for completion before returning response",
+                },
+            ),
+            "enable_base64_output": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Return BASE64-encoded output instead of URL",
+                },
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description of the image to generate (Chinese or English)",
-                    },
-                ),
-            },
-            "optional": {
-                "width": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (256 to 1536)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 256,
-                        "max": 1536,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (256 to 1536)",
-                    },
-                ),
-                "seed": (
-                    "INT",
-                    {
-                        "default": -1,
-                        "min": -1,
-                        "max": 2147483647,
-                        "tooltip": "Random seed for reproducibility (-1 for random)",
-                    },
-                ),
-                "output_format": (
-                    ["jpeg", "png", "webp"],
-                    {
-                        "default": "jpeg",
-                        "tooltip": "Output image format",
-                    },
-                ),
-                "enable_sync_mode": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Wait for completion before returning response",
-                    },
-                ),
-                "enable_base64_output": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Return BASE64-encoded output instead of URL",
-                    },
-                ),
-            },
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("image",)
@@ -98,20 +102,19 @@ class QwenImageTextToImageNode:
         enable_sync_mode=False,
         enable_base64_output=False,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
         request = QwenImageTextToImage(
             prompt=prompt,
-            size=f"{width}*{height}",
+            size=fmt_size(width, height),
             seed=seed,
             output_format=output_format,
             enable_sync_mode=enable_sync_mode,
             enable_base64_output=enable_base64_output,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
@@ -1,5 +1,5 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.utils import ensure_prompt, imageurl2tensor
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.seedream_v4 import SeedreamV4
 
 
@@ -10,44 +10,48 @@ class SeedreamV4Node:
     This node uses ByteDance's Seedream-V4 model to generate high-quality images.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the image to generate",
+                },
+            ),
+            "width": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 0,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (1024 to 4096)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 0,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (1024 to 4096)",
+                },
+            ),
+        },
+        "optional": {},
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description of the image to generate",
-                    },
-                ),
-                "width": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 0,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (1024 to 4096)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 0,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (1024 to 4096)",
-                    },
-                ),
-            },
-            "optional": {},
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("image",)
@@ -64,8 +68,7 @@ class SeedreamV4Node:
         seed=-1,
         guidance_scale=2.5,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
         request = SeedreamV4(
             prompt=prompt,
@@ -74,8 +77,8 @@ class SeedreamV4Node:
             height=height,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
@@ -1,5 +1,5 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.utils import ensure_prompt, fmt_size, imageurl2tensor
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.seedream_v4_edit import SeedreamV4Edit
 
 
@@ -10,65 +10,69 @@ class SeedreamV4EditNode:
     This node uses ByteDance's Seedream V4 Edit model to edit images based on text prompts.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description of the desired image modifications",
+                },
+            ),
+            "images": (
+                "STRING",
+                {
+                    "tooltip": "The images to edit. A maximum of 10 reference images can be uploaded.",
+                },
+            ),
+        },
+        "optional": {
+            "width": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 0,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (1024 to 4096)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 0,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (1024 to 4096)",
+                },
+            ),
+            "enable_sync_mode": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "If set to true, the function will wait for the result to be generated and uploaded before returning the response. It allows you to get the result directly in the response. This property is only available through the API.",
+                },
+            ),
+            "enable_base64_output": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "If enabled, the output will be encoded into a BASE64 string instead of a URL. This property is only available through the API.",
+                },
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description of the desired image modifications",
-                    },
-                ),
-                "images": (
-                    "STRING",
-                    {
-                        "tooltip": "The images to edit. A maximum of 10 reference images can be uploaded.",
-                    },
-                ),
-            },
-            "optional": {
-                "width": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 0,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (1024 to 4096)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 0,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (1024 to 4096)",
-                    },
-                ),
-                "enable_sync_mode": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "If set to true, the function will wait for the result to be generated and uploaded before returning the response. It allows you to get the result directly in the response. This property is only available through the API.",
-                    },
-                ),
-                "enable_base64_output": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "If enabled, the output will be encoded into a BASE64 string instead of a URL. This property is only available through the API.",
-                    },
-                ),
-            },
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("image",)
@@ -86,8 +90,7 @@ class SeedreamV4EditNode:
         enable_sync_mode=False,
         enable_base64_output=False,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
         if images is None or images == "":
             raise ValueError("Images must be provided")
@@ -98,13 +101,13 @@ class SeedreamV4EditNode:
         request = SeedreamV4Edit(
             prompt=prompt,
             images=images_param,
-            size=f"{width}*{height}",
+            size=fmt_size(width, height),
             enable_sync_mode=enable_sync_mode,
             enable_base64_output=enable_base64_output,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
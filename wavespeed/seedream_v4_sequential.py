@@ -1,5 +1,10 @@
-from .wavespeed_api.utils import imageurl2tensor
-from .wavespeed_api.client import WaveSpeedClient
+from .wavespeed_api.utils import (
+    build_sequential_prompt,
+    ensure_prompt,
+    fmt_size,
+    imageurl2tensor,
+)
+from .wavespeed_api.client import get_client
 from .wavespeed_api.requests.seedream_v4_sequential import SeedreamV4Sequential
 
 
@@ -11,70 +16,74 @@ class SeedreamV4SequentialNode:
     coherent images with cross-image consistency in a single pipeline.
     """
 
+    # Built once at class definition; ComfyUI re-reads this on
+    # every graph validation and UI refresh
+    _INPUT_TYPES = {
+        "required": {
+            "client": ("WAVESPEED_AI_API_CLIENT",),
+            "prompt": (
+                "STRING",
+                {
+                    "multiline": True,
+                    "default": "",
+                    "tooltip": "Text description for image generation. The node automatically appends the image count to your prompt.",
+                },
+            ),
+            "max_images": (
+                "INT",
+                {
+                    "default": 4,
+                    "min": 1,
+                    "max": 15,
+                    "step": 1,
+                    "display": "number",
+                    "tooltip": "Number of images to generate (1-15). Automatically added to prompt for API compliance.",
+                },
+            ),
+        },
+        "optional": {
+            "width": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 1024,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image width (1024 to 4096)",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 2048,
+                    "min": 1024,
+                    "max": 4096,
+                    "step": 8,
+                    "display": "number",
+                    "tooltip": "Image height (1024 to 4096)",
+                },
+            ),
+            "enable_sync_mode": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Wait for result generation before returning response",
+                },
+            ),
+            "enable_base64_output": (
+                "BOOLEAN",
+                {
+                    "default": False,
+                    "tooltip": "Return BASE64 encoded output instead of URLs",
+                },
+            ),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "client": ("WAVESPEED_AI_API_CLIENT",),
-                "prompt": (
-                    "STRING",
-                    {
-                        "multiline": True,
-                        "default": "",
-                        "tooltip": "Text description for image generation. The node automatically appends the image count to your prompt.",
-                    },
-                ),
-                "max_images": (
-                    "INT",
-                    {
-                        "default": 4,
-                        "min": 1,
-                        "max": 15,
-                        "step": 1,
-                        "display": "number",
-                        "tooltip": "Number of images to generate (1-15). Automatically added to prompt for API compliance.",
-                    },
-                ),
-            },
-            "optional": {
-                "width": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 1024,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image width (1024 to 4096)",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 2048,
-                        "min": 1024,
-                        "max": 4096,
-                        "step": 8,
-                        "display": "number",
-                        "tooltip": "Image height (1024 to 4096)",
-                    },
-                ),
-                "enable_sync_mode": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Wait for result generation before returning response",
-                    },
-                ),
-                "enable_base64_output": (
-                    "BOOLEAN",
-                    {
-                        "default": False,
-                        "tooltip": "Return BASE64 encoded output instead of URLs",
-                    },
-                ),
-            },
-        }
+        return s._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("images",)
@@ -92,24 +101,23 @@ class SeedreamV4SequentialNode:
         enable_sync_mode=False,
         enable_base64_output=False,
     ):
-        if prompt is None or prompt == "":
-            raise ValueError("Prompt is required")
+        ensure_prompt(prompt)
 
         if max_images < 1 or max_images > 15:
             raise ValueError("max_images must be between 1 and 15")
 
-        generatePrompt = f"{prompt}. Generate a set of {max_images} consecutive."
+        generatePrompt = build_sequential_prompt(prompt, max_images)
 
         request = SeedreamV4Sequential(
             prompt=generatePrompt,
             max_images=max_images,
-            size=f"{width}*{height}",
+            size=fmt_size(width, height),
             enable_sync_mode=enable_sync_mode,
             enable_base64_output=enable_base64_output,
         )
 
-        waveSpeedClient = WaveSpeedClient(client["api_key"])
-        response = waveSpeedClient.send_request(request, True, 1)
+        waveSpeedClient = get_client(client["api_key"])
+        response = waveSpeedClient.send_request(request, True)
 
         # Download and process images
         image_urls = response.get("outputs", [])
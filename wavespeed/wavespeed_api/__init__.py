@@ -2,11 +2,13 @@
 WaveSpeed API module for ComfyUI integration
 """
 
-from .client import WaveSpeedClient
+from .client import SESSION, WaveSpeedClient, get_client
 from .utils import BaseRequest, imageurl2tensor, tensor2images, image_to_base64
 
 __all__ = [
+    'SESSION',
     'WaveSpeedClient',
+    'get_client',
     'BaseRequest',
     'imageurl2tensor',
     'tensor2images',
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -36,34 +36,18 @@ class QwenImageEdit(BaseRequest):
         description="Waits for completion before responding.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "size": self.size,
-            "seed": self.seed,
-            "output_format": self.output_format,
-            "enable_base64_output": self.enable_base64_output,
-            "enable_sync_mode": self.enable_sync_mode,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
         return "/api/v3/wavespeed-ai/qwen-image/edit"
 
-    def field_required(self):
-        return ["prompt", "image"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return [
-            "prompt",
-            "image",
-            "size",
-            "seed",
-            "output_format",
-            "enable_base64_output",
-            "enable_sync_mode",
-        ]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt", "image")
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "prompt",
+        "image",
+        "size",
+        "seed",
+        "output_format",
+        "enable_base64_output",
+        "enable_sync_mode",
+    )
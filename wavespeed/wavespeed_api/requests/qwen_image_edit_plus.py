@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import ClassVar, Optional, List
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -38,34 +38,18 @@ class QwenImageEditPlus(BaseRequest):
         description="Waits for completion; returns result directly.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "images": self.images,
-            "size": self.size,
-            "seed": self.seed,
-            "output_format": self.output_format,
-            "enable_base64_output": self.enable_base64_output,
-            "enable_sync_mode": self.enable_sync_mode,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
         return "/api/v3/wavespeed-ai/qwen-image/edit-plus"
 
-    def field_required(self):
-        return ["prompt", "images"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return [
-            "prompt",
-            "images",
-            "size",
-            "seed",
-            "output_format",
-            "enable_base64_output",
-            "enable_sync_mode",
-        ]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt", "images")
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "prompt",
+        "images",
+        "size",
+        "seed",
+        "output_format",
+        "enable_base64_output",
+        "enable_sync_mode",
+    )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -31,32 +31,17 @@ class QwenImageTextToImage(BaseRequest):
         description="If enabled, returns BASE64-encoded output instead of URL.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "size": self.size,
-            "seed": self.seed,
-            "output_format": self.output_format,
-            "enable_sync_mode": self.enable_sync_mode,
-            "enable_base64_output": self.enable_base64_output,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
         return "/api/v3/wavespeed-ai/qwen-image/text-to-image"
 
-    def field_required(self):
-        return ["prompt"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return [
-            "prompt",
-            "size",
-            "seed",
-            "output_format",
-            "enable_sync_mode",
-            "enable_base64_output",
-        ]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt",)
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "prompt",
+        "size",
+        "seed",
+        "output_format",
+        "enable_sync_mode",
+        "enable_base64_output",
+    )
@@ -1,6 +1,6 @@
-from typing import Optional
-from pydantic import Field
-from ..utils import BaseRequest
+from typing import ClassVar, Optional
+from pydantic import Field, computed_field
+from ..utils import BaseRequest, fmt_size
 
 
 class SeedreamV4(BaseRequest):
@@ -10,27 +10,25 @@ class SeedreamV4(BaseRequest):
 
     prompt: str = Field(..., description="The prompt to generate an image from.")
     width: Optional[int] = Field(
-        default=2048, description="The width of the generated image.", ge=0, le=4096
+        default=2048, description="The width of the generated image.", ge=0, le=4096,
+        exclude=True
     )
     height: Optional[int] = Field(
-        default=2048, description="The height of the generated image.", ge=0, le=4096
+        default=2048, description="The height of the generated image.", ge=0, le=4096,
+        exclude=True
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "size": f"{self.width}*{self.height}",
-        }
-        return self._remove_empty_fields(payload)
+    @computed_field
+    @property
+    def size(self) -> str:
+        """API size string derived from width and height."""
+        # Cached formatter: node graphs reuse a handful of resolutions
+        return fmt_size(self.width, self.height)
 
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
         return "/api/v3/bytedance/seedream-v4"
 
-    def field_required(self):
-        return ["prompt"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return ["prompt", "size"]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt",)
+    FIELDS_ORDER: ClassVar[tuple] = ("prompt", "size")
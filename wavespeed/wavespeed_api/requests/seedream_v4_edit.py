@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import ClassVar, Optional, List
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -33,24 +33,16 @@ class SeedreamV4Edit(BaseRequest):
         description="If enabled, the output will be encoded into a BASE64 string instead of a URL. This property is only available through the API.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "images": self.images,
-            "size": self.size,
-            "enable_sync_mode": self.enable_sync_mode,
-            "enable_base64_output": self.enable_base64_output,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
         return "/api/v3/bytedance/seedream-v4/edit"
 
-    def field_required(self):
-        return ["image", "prompt"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return ["image", "prompt", "size", "enable_sync_mode", "enable_base64_output"]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("image", "prompt")
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "image",
+        "prompt",
+        "size",
+        "enable_sync_mode",
+        "enable_base64_output",
+    )
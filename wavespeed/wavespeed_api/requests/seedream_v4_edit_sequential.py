@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import ClassVar, Optional, List
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -42,25 +42,17 @@ class SeedreamV4EditSequential(BaseRequest):
         description="If enabled, the output will be encoded into a BASE64 string instead of a URL.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "max_images": self.max_images,
-            "images": self.images,
-            "size": self.size,
-            "enable_sync_mode": self.enable_sync_mode,
-            "enable_base64_output": self.enable_base64_output,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path."""
         return "/api/v3/bytedance/seedream-v4/edit-sequential"
 
-    def field_required(self):
-        return ["prompt", "max_images"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return ["prompt", "max_images", "images", "size", "enable_sync_mode", "enable_base64_output"]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt", "max_images")
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "prompt",
+        "max_images",
+        "images",
+        "size",
+        "enable_sync_mode",
+        "enable_base64_output",
+    )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -7,6 +7,9 @@ class SeedreamV4Sequential(BaseRequest):
     """
     ByteDance Seedream-V4 Sequential text to image model
     Enables multi-image generation with cross-image consistency
+
+    max_images=N is a single server-side task: one POST, one polling
+    loop, one result carrying N output URLs — not N round-trips.
     """
 
     prompt: str = Field(..., description="The prompt to generate images from.")
@@ -33,24 +36,16 @@ class SeedreamV4Sequential(BaseRequest):
         description="If enabled, the output will be encoded into a BASE64 string instead of a URL.",
     )
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "max_images": self.max_images,
-            "size": self.size,
-            "enable_sync_mode": self.enable_sync_mode,
-            "enable_base64_output": self.enable_base64_output,
-        }
-        return self._remove_empty_fields(payload)
-
     def get_api_path(self):
         """Gets the API path."""
         return "/api/v3/bytedance/seedream-v4/sequential"
 
-    def field_required(self):
-        return ["prompt", "max_images"]
-
-    def field_order(self):
-        """Corresponds to x-order-properties in the JSON request_schema."""
-        return ["prompt", "max_images", "size", "enable_sync_mode", "enable_base64_output"]
+    # Corresponds to x-order-properties in the JSON request_schema
+    FIELDS_REQUIRED: ClassVar[tuple] = ("prompt", "max_images")
+    FIELDS_ORDER: ClassVar[tuple] = (
+        "prompt",
+        "max_images",
+        "size",
+        "enable_sync_mode",
+        "enable_base64_output",
+    )
@@ -2,21 +2,47 @@
 Utility functions for WaveSpeed API integration
 """
 
-import base64
+import binascii
+import functools
+import threading
+import hashlib
 import io
+import os
 import requests
 import numpy
-from typing import List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, List, Optional, Union
 from collections.abc import Iterable
-from pydantic import BaseModel
+from urllib3.util.retry import Retry
+from pydantic import BaseModel, ConfigDict
+
+class _LazyTorch:
+    """
+    Stand-in bound to the module-level ``torch`` name when torch is not
+    importable at module load (e.g. during ComfyUI node discovery).
+
+    The first attribute access imports torch and rebinds the module
+    global to the real module, so every later lookup in the hot
+    functions resolves directly — no per-call import check needed.
+    """
+
+    def __getattr__(self, name):
+        global torch
+        import torch as _torch
+        torch = _torch
+        return getattr(_torch, name)
+
 
 # Import torch with proper error handling for ComfyUI
 try:
     import torch
+    _TORCH_AVAILABLE = True
 except ImportError:
-    # This might happen during module discovery or outside ComfyUI
-    # We'll try to import it later when actually needed
-    torch = None
+    # This might happen during module discovery or outside ComfyUI;
+    # the lazy stand-in retries the import on first actual use
+    torch = _LazyTorch()
+    _TORCH_AVAILABLE = False
     import sys
     print("[WaveSpeed] Warning: torch not found during initial import. This is normal if not running in ComfyUI.", file=sys.stderr)
 
@@ -25,6 +51,180 @@ try:
 except ImportError:
     from PIL import Image as PIL
 
+# libjpeg-turbo decodes JPEG with SIMD IDCT/colorspace conversion, several
+# times faster than PIL on typical 1024x1024 outputs; optional dependency
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBO_JPEG = TurboJPEG()
+except Exception:
+    _TURBO_JPEG = None
+
+# nvJPEG offloads JPEG decode (the default output format) to the GPU,
+# freeing the CPU decode threads entirely; optional, needs torchvision
+# with CUDA support and is only used when a CUDA device is present
+try:
+    from torchvision.io import (
+        ImageReadMode,
+        decode_jpeg as _tv_decode_jpeg,
+        encode_jpeg as _tv_encode_jpeg,
+    )
+except Exception:
+    _tv_decode_jpeg = None
+    _tv_encode_jpeg = None
+
+# HTTP/2 lets the concurrent download workers multiplex all of a
+# sequential batch's fetches over one TLS connection to the CDN instead
+# of opening a socket per worker; optional dependency (needs httpx[http2])
+try:
+    import httpx
+    _HTTPX_CLIENT = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    )
+except Exception:
+    _HTTPX_CLIENT = None
+
+
+# Shared session for the HTTP/1.1 download fallback: bare requests.get
+# builds and tears down a throwaway session (DNS, TLS handshake,
+# connection pool) per URL, while a module-level Session keeps CDN
+# connections warm across the download workers. Pool sized to the
+# fetch executor so no worker blocks waiting for a connection, and
+# transient CDN errors retry with backoff instead of dropping the image
+_DOWNLOAD_SESSION = requests.Session()
+_DOWNLOAD_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+        ),
+    ),
+)
+
+
+# Content-addressed disk cache of downloaded image bytes: re-running a
+# workflow revisits the same CDN URLs, so a hit skips the whole HTTP
+# round-trip. Optional dependency; without diskcache the (smaller)
+# in-memory result cache below still covers seeded re-runs
+try:
+    import diskcache
+    _URL_CACHE = diskcache.Cache(
+        os.path.expanduser("~/.cache/erpk-wavespeed"),
+        size_limit=2 * 1024 ** 3,  # 2 GB, LRU-evicted
+    )
+except Exception:
+    _URL_CACHE = None
+
+
+# Scale factor for uint8 -> [0, 1] float32 normalization, hoisted so the
+# per-image loop multiplies by a ready-made float32 scalar
+_INV_255 = numpy.float32(1.0 / 255.0)
+
+
+# Content-addressed cache of decoded result tensors: re-running an
+# identical deterministic request (common while iterating on a workflow
+# in the UI) returns the cached batch instead of a new API round-trip.
+_RESULT_CACHE: OrderedDict = OrderedDict()
+_RESULT_CACHE_CAP = 32
+
+
+def result_cache_key(*parts) -> str:
+    """Build a stable cache key from the request-defining parameters."""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def result_cache_get(key: str):
+    """
+    Look up a cached result tensor.
+
+    Args:
+        key: Key from result_cache_key
+
+    Returns:
+        Copy of the cached tensor, or None on miss
+    """
+    tensor = _RESULT_CACHE.get(key)
+    if tensor is None:
+        return None
+    _RESULT_CACHE.move_to_end(key)
+    # Hand out a private copy: downstream nodes mutate IMAGE tensors in
+    # place, which would otherwise poison the cached entry
+    return tensor.clone()
+
+
+def result_cache_put(key: str, tensor):
+    """
+    Store a result tensor, evicting the least recently used entries.
+
+    Args:
+        key: Key from result_cache_key
+        tensor: Decoded result batch to cache
+    """
+    # Store a copy too: the caller returns its tensor to the graph, where
+    # it stays mutable long after this entry was written
+    _RESULT_CACHE[key] = tensor.clone()
+    _RESULT_CACHE.move_to_end(key)
+    while len(_RESULT_CACHE) > _RESULT_CACHE_CAP:
+        _RESULT_CACHE.popitem(last=False)
+
+
+def ensure_prompt(prompt) -> None:
+    """
+    Validate that a prompt was provided.
+
+    Shared by every generation node so the check (and its error message)
+    lives in one place.
+
+    Args:
+        prompt: Prompt string from the node inputs
+
+    Raises:
+        ValueError: If the prompt is missing or empty
+    """
+    if not prompt:
+        raise ValueError("Prompt is required")
+
+
+# Pre-bound suffix template so the builder does one concatenation
+# instead of re-parsing an f-string per call
+_SEQUENTIAL_SUFFIX = ". Generate a set of {} consecutive.".format
+
+
+def build_sequential_prompt(prompt: str, max_images: int) -> str:
+    """
+    Append the consecutive-set instruction used by the sequential nodes.
+
+    Args:
+        prompt: User prompt
+        max_images: Number of consecutive images to request
+
+    Returns:
+        str: Prompt with the sequential-generation suffix
+    """
+    return prompt + _SEQUENTIAL_SUFFIX(max_images)
+
+
+@functools.lru_cache(maxsize=32)
+def fmt_size(width: int, height: int) -> str:
+    """
+    Format a width*height size string for API payloads.
+
+    Cached because the same few dimensions recur across every image in a
+    workflow batch.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        str: Size string in the API's "W*H" format
+    """
+    return f"{width}*{height}"
+
 
 def imageurl2tensor(image_urls: List[str]):
     """
@@ -36,102 +236,314 @@ def imageurl2tensor(image_urls: List[str]):
     Returns:
         torch.Tensor: Batch of images as tensors (B, H, W, C)
     """
-    # Late import of torch if not already imported
-    global torch
-    if torch is None:
-        import torch
-
-    images = []
     if not image_urls:
         # Return a minimal valid tensor if no images
         return torch.zeros((1, 1, 1, 3))
 
-    for url in image_urls:
+    def _fetch_bytes(url):
+        cache_key = None
+        if _URL_CACHE is not None:
+            cache_key = hashlib.sha1(url.encode()).hexdigest()
+            data = _URL_CACHE.get(cache_key)
+            if data is not None:
+                return data
+
         try:
-            # Download image
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            image_data = response.content
+            # Download image, multiplexing over HTTP/2 when available
+            if _HTTPX_CLIENT is not None:
+                response = _HTTPX_CLIENT.get(url, timeout=30)
+                response.raise_for_status()
+                data = response.content
+            else:
+                # (connect, read) split: fail fast on unreachable hosts
+                # without cutting short a slow large-image body
+                response = _DOWNLOAD_SESSION.get(url, stream=True, timeout=(5, 30))
+                response.raise_for_status()
+                data = response.content
+        except Exception as e:
+            print(f"[WaveSpeed] Error downloading image from {url}: {e}")
+            return None
 
-            # Decode image
+        if cache_key is not None:
+            _URL_CACHE.set(cache_key, data)
+        return data
+
+    def _decode_image(image_data):
+        try:
+            # JPEG payloads (the Qwen nodes' default output format) go
+            # through libjpeg-turbo when available; its decoder writes
+            # straight into a numpy buffer, skipping the PIL round-trip
+            if _TURBO_JPEG is not None and image_data[:2] == b'\xff\xd8':
+                return _TURBO_JPEG.decode(image_data, pixel_format=TJPF_RGB)
+
+            # BytesIO over an immutable bytes object shares the buffer
+            # (copy-on-write in CPython), so wrapping the downloaded
+            # payload for PIL costs no extra image-sized allocation
             with io.BytesIO(image_data) as bytes_io:
                 img = PIL.Image.open(bytes_io)
-                img = img.convert('RGB')
-                images.append(img)
+                # Force the decode while the buffer is alive; convert
+                # only when the mode actually differs, since JPEG output
+                # already decodes as RGB and convert would copy the image
+                img.load()
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                return img
         except Exception as e:
-            print(f"[WaveSpeed] Error downloading/processing image from {url}: {e}")
-            continue
+            print(f"[WaveSpeed] Error decoding downloaded image: {e}")
+            return None
 
-    if not images:
+    # The batched nvJPEG call needs every payload up front, so GPU-eligible
+    # batches fetch in one stage; otherwise fetch and CPU decode pipeline
+    gpu_eligible = _tv_decode_jpeg is not None and torch.cuda.is_available()
+
+    # Downloads are pure network I/O, so fetch multi-URL results (e.g.
+    # sequential nodes returning up to 15 outputs) concurrently; map
+    # preserves URL order and failed downloads are skipped as before.
+    # One worker per URL (up to 16) lets a full sequential batch land in
+    # roughly one download's wall time. Repeated URLs (retry artifacts,
+    # echoed inputs) are fetched once and fanned back out by position
+    if len(image_urls) == 1:
+        # Single-output nodes dominate interactive use; skip the dedupe
+        # map and executor spin-up entirely
+        data = _fetch_bytes(image_urls[0])
+        payloads = [data] if data is not None else []
+    elif not gpu_eligible:
+        # Pipeline the two CPU-path stages: each payload is handed to the
+        # decode pool the moment its download lands, so decode (CPU-bound,
+        # GIL released in libjpeg/libpng) overlaps the remaining network
+        # waits and wall time approaches max(download, decode) instead of
+        # their sum. In-flight memory stays bounded by the fetch worker
+        # count plus the decode backlog, itself capped by the API's
+        # 15-output batch limit. The fetch pool exits first so no decode
+        # submission can race the decode pool's shutdown
+        unique_urls = list(dict.fromkeys(image_urls))
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(unique_urls))
+        ) as decode_pool, ThreadPoolExecutor(
+            max_workers=min(16, len(unique_urls))
+        ) as fetch_pool:
+
+            def _fetch_then_decode(url):
+                data = _fetch_bytes(url)
+                if data is None:
+                    return None
+                return decode_pool.submit(_decode_image, data)
+
+            decode_futures = list(fetch_pool.map(_fetch_then_decode, unique_urls))
+            decoded_by_url = {
+                url: (future.result() if future is not None else None)
+                for url, future in zip(unique_urls, decode_futures)
+            }
+
+        images = [
+            decoded_by_url[url] for url in image_urls
+            if decoded_by_url[url] is not None
+        ]
+
+        if not images:
+            # Return minimal tensor if every download or decode failed
+            return torch.zeros((1, 1, 1, 3))
+        return images2tensor(images)
+    else:
+        unique_urls = list(dict.fromkeys(image_urls))
+        if len(unique_urls) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(unique_urls))) as executor:
+                fetched = list(executor.map(_fetch_bytes, unique_urls))
+        else:
+            fetched = [_fetch_bytes(unique_urls[0])]
+
+        payload_by_url = dict(zip(unique_urls, fetched))
+        payloads = [
+            payload_by_url[url] for url in image_urls
+            if payload_by_url[url] is not None
+        ]
+
+    if not payloads:
         # Return minimal tensor if all downloads failed
         return torch.zeros((1, 1, 1, 3))
 
+    # All-JPEG batches can decode on the GPU via nvJPEG, keeping the CPU
+    # free; any surprise (mixed sizes, truncated payload, old torchvision)
+    # falls back to the CPU decoders below
+    if gpu_eligible and all(data[:2] == b'\xff\xd8' for data in payloads):
+        try:
+            channels_first = _tv_decode_jpeg(
+                [
+                    torch.frombuffer(bytearray(data), dtype=torch.uint8)
+                    for data in payloads
+                ],
+                mode=ImageReadMode.RGB,
+                device="cuda",
+            )
+            # Materialize the NHWC permute while still uint8 (1 byte/px):
+            # downstream ops expect a contiguous layout and would otherwise
+            # insert their own copy of the float tensor
+            batch = torch.stack(channels_first).permute(0, 2, 3, 1).contiguous()
+            # ComfyUI IMAGE tensors live on the CPU between nodes
+            return batch.float().div_(255.0).cpu()
+        except Exception as e:
+            print(f"[WaveSpeed] GPU JPEG decode failed, using CPU path: {e}")
+
+    # CPU decode: PIL/libjpeg release the GIL, so threads overlap here too
+    if len(payloads) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(payloads))) as executor:
+            results = list(executor.map(_decode_image, payloads))
+    else:
+        results = [_decode_image(payloads[0])]
+
+    images = [img for img in results if img is not None]
+
+    if not images:
+        # Return minimal tensor if all payloads were undecodable
+        return torch.zeros((1, 1, 1, 3))
+
     # Convert images to tensor
     return images2tensor(images)
 
 
-def images2tensor(images: Union[List[PIL.Image.Image], PIL.Image.Image]):
+def images2tensor(images: Union[List, PIL.Image.Image, numpy.ndarray]):
     """
-    Convert PIL images to ComfyUI tensor format.
+    Convert decoded images to ComfyUI tensor format.
 
     Args:
-        images: Single PIL image or list of PIL images
+        images: Single image or list of images; each entry may be a PIL
+            image or an HWC uint8 RGB numpy array (e.g. straight from
+            libjpeg-turbo)
 
     Returns:
-        torch.Tensor: Images as tensor (B, H, W, C) normalized to [0, 1]
+        torch.Tensor: Images as tensor (B, H, W, C) normalized to [0, 1].
+        The batch is written into a single pre-allocated tensor — there
+        is no per-image tensor list and no trailing stack copy
     """
-    # Late import of torch if not already imported
-    global torch
-    if torch is None:
-        import torch
-
-    if isinstance(images, PIL.Image.Image):
+    if isinstance(images, (PIL.Image.Image, numpy.ndarray)):
         images = [images]
 
     if not isinstance(images, Iterable):
-        raise ValueError("images must be a PIL Image or iterable of PIL Images")
-
-    # Convert each image to tensor
-    tensors = []
-    for img in images:
-        # Convert to numpy array
-        np_img = numpy.array(img, dtype=numpy.float32)
-        # Normalize to [0, 1]
-        np_img = np_img / 255.0
-        # Convert to tensor
-        tensor = torch.from_numpy(np_img)
-        tensors.append(tensor)
-
-    # Stack into batch
-    return torch.stack(tensors)
+        raise ValueError("images must be a PIL Image, ndarray, or iterable of them")
+
+    # Normalize everything to HWC uint8 RGB arrays; numpy.asarray over a
+    # PIL image copies once (PIL only exposes its pixels via tobytes(),
+    # so one copy per image is the floor here), turbojpeg output passes
+    # through as-is
+    arrays = [
+        numpy.asarray(img.convert('RGB') if img.mode != 'RGB' else img)
+        if isinstance(img, PIL.Image.Image) else numpy.asarray(img)
+        for img in images
+    ]
+
+    # A batch tensor needs uniform dimensions, so conform any odd-sized
+    # outputs (edit/sequential responses occasionally vary) to the first
+    # image before filling the batch
+    # Single-image calls (the common interactive case) skip the
+    # shape-conformance scan outright
+    first_shape = arrays[0].shape
+    if len(arrays) > 1 and not all(a.shape == first_shape for a in arrays):
+        height, width = first_shape[:2]
+        arrays = [
+            a if a.shape == first_shape
+            else numpy.asarray(
+                PIL.Image.fromarray(a).resize((width, height), PIL.Image.LANCZOS)
+            )
+            for a in arrays
+        ]
+
+    # Normalize straight into one pre-allocated batch tensor, filling it
+    # through a numpy view — no per-image tensors, no torch.stack.
+    # Multiplying by the reciprocal lets numpy use its vectorized multiply
+    # kernel; division is markedly slower on large buffers, and the ufunc
+    # casts each uint8 row to float32 in the same pass, so pixels expand
+    # from 1 to 4 bytes exactly once with no intermediate. When CUDA is
+    # present the buffer is page-locked so a downstream .to("cuda") can
+    # DMA it asynchronously instead of staging through pageable memory
+    height, width = first_shape[:2]
+    batch = torch.empty(
+        (len(arrays), height, width, 3),
+        dtype=torch.float32,
+        pin_memory=torch.cuda.is_available(),
+    )
+    out = batch.numpy()
+    for i, array in enumerate(arrays):
+        # casting="unsafe" keeps the uint8 -> float32 widening inside the
+        # single vectorized ufunc pass on every numpy version (promotion
+        # rules differ between the legacy and NEP 50 schemes); the cast
+        # is value-preserving here, 0..255 fits float32 exactly
+        numpy.multiply(array, _INV_255, out=out[i], casting="unsafe")
+    return batch
 
 
 def tensor2images(tensor) -> List[PIL.Image.Image]:
     """
     Convert ComfyUI tensor to PIL images.
 
+    Already-CPU, already-contiguous inputs cross the torch/numpy
+    boundary without a device copy or re-materialization.
+
     Args:
         tensor: ComfyUI image tensor (B, H, W, C)
 
     Returns:
         List[PIL.Image.Image]: List of PIL images
     """
-    # Late import of torch if not already imported
-    global torch
-    if torch is None:
-        import torch
-
     # Handle both (B, H, W, C) and (H, W, C) formats
     if len(tensor.shape) == 3:
         tensor = tensor.unsqueeze(0)
 
-    # Convert to numpy and denormalize
-    np_imgs = numpy.clip(tensor.cpu().numpy() * 255.0, 0.0, 255.0).astype(numpy.uint8)
+    # Denormalize on the tensor itself — on-device when the input still
+    # lives on the GPU — so a single uint8 batch crosses into numpy
+    # instead of a float32 copy plus numpy temporaries for the multiply
+    # and the clip (4x the memory traffic)
+    t = tensor.detach()
+    if t.is_floating_point():
+        t = t.mul(255.0).clamp_(0.0, 255.0).to(torch.uint8)
+    if t.device.type != "cpu":
+        t = t.cpu()
+    if not t.is_contiguous():
+        t = t.contiguous()
+    np_imgs = t.numpy()
 
     # Convert each image to PIL
     return [PIL.Image.fromarray(np_img) for np_img in np_imgs]
 
 
+# Deflate level for masked PNG encodes; matches the fast setting the
+# upload path in client.py already uses
+_PNG_COMPRESS_LEVEL = 1
+
+
+# Per-thread reusable encode buffer: batched base64 conversion calls
+# encode_image once per image, and rewinding one BytesIO per worker
+# thread avoids regrowing a fresh multi-megabyte buffer each time
+_encode_buffers = threading.local()
+
+
+def _encode_buffer() -> io.BytesIO:
+    """Return this thread's encode buffer, rewound and emptied."""
+    buf = getattr(_encode_buffers, "buffer", None)
+    if buf is None:
+        buf = io.BytesIO()
+        _encode_buffers.buffer = buf
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
+
+def _b64(data: bytes) -> str:
+    """
+    Base64-encode bytes to str.
+
+    binascii.b2a_base64 is what base64.b64encode wraps; calling it
+    directly drops a Python-level frame per blob, and decoding with the
+    ascii codec takes CPython's fast path for the pure-ASCII output.
+
+    Args:
+        data: Raw bytes to encode
+
+    Returns:
+        str: Base64 string without trailing newline
+    """
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
 def encode_image(img: PIL.Image.Image, mask: Optional[PIL.Image.Image] = None) -> bytes:
     """
     Encode PIL image to bytes.
@@ -147,54 +559,80 @@ def encode_image(img: PIL.Image.Image, mask: Optional[PIL.Image.Image] = None) -
         img = img.copy()
         img.putalpha(mask)
 
-    with io.BytesIO() as bytes_io:
-        if mask is not None:
-            img.save(bytes_io, format='PNG')
-        else:
-            img.save(bytes_io, format='JPEG', quality=95)
-        data_bytes = bytes_io.getvalue()
+    bytes_io = _encode_buffer()
+    if mask is not None:
+        # Level-1 deflate encodes several times faster than the default
+        # level 6 for a modest size increase; optimize=False skips the
+        # extra trial passes. Tunable for deployments that prefer size
+        img.save(
+            bytes_io,
+            format='PNG',
+            compress_level=_PNG_COMPRESS_LEVEL,
+            optimize=False,
+        )
+    else:
+        img.save(bytes_io, format='JPEG', quality=95)
+    return bytes_io.getvalue()
 
-    return data_bytes
 
+def _tensor_to_base64(image) -> Optional[str]:
+    """
+    Encode the first batch element of a tensor as a base64 string.
+
+    Only the first batch element is encoded, so 4-D inputs are sliced
+    (a view, no copy) before the conversion instead of denormalizing a
+    whole batch and discarding all but one image.
+    """
+    pil_images = tensor2images(image[0:1] if image.ndim == 4 else image)
+    if not pil_images:
+        return None
+    return _b64(encode_image(pil_images[0]))
 
-def image_to_base64(image: Union[PIL.Image.Image, object]) -> Optional[str]:
+
+@functools.singledispatch
+def image_to_base64(image) -> Optional[str]:
     """
     Convert image to base64 string.
 
+    Dispatch is specialized per input type: PIL images (the cheapest
+    path) and tensors resolve their handler through singledispatch's
+    type-keyed cache instead of re-running an isinstance chain per call.
+
     Args:
         image: Image as tensor or PIL Image
 
     Returns:
         str: Base64 encoded image string
     """
-    # Late import of torch if not already imported
-    global torch
-    if torch is None:
-        try:
-            import torch
-        except ImportError:
-            # If we can't import torch and the image is a tensor, we can't process it
-            if not isinstance(image, PIL.Image.Image):
-                raise ImportError("torch is required to process tensor images")
-
+    # Default handler: only reached for None, for tensors when torch was
+    # not importable during module discovery, or for unsupported types
     if image is None:
         return None
 
-    # Convert tensor to PIL if needed
-    if torch and isinstance(image, torch.Tensor):
-        pil_images = tensor2images(image)
-        if not pil_images:
-            return None
-        pil_image = pil_images[0]
-    elif not isinstance(image, PIL.Image.Image):
-        # If torch isn't available and this isn't a PIL image, we can't process it
-        raise ValueError(f"Cannot process image of type {type(image)} without torch")
-    else:
-        pil_image = image
+    try:
+        # Attribute access resolves torch through the lazy stand-in if
+        # it was not importable at module load
+        tensor_type = torch.Tensor
+    except ImportError:
+        raise ImportError("torch is required to process tensor images")
+
+    if isinstance(image, tensor_type):
+        # torch resolved after import time; register the handler so
+        # subsequent tensor calls dispatch directly
+        image_to_base64.register(tensor_type, _tensor_to_base64)
+        return _tensor_to_base64(image)
+
+    raise ValueError(f"Cannot process image of type {type(image)} without torch")
 
-    # Encode to base64
-    image_bytes = encode_image(pil_image)
-    return base64.b64encode(image_bytes).decode("utf-8")
+
+@image_to_base64.register(PIL.Image.Image)
+def _pil_to_base64(image) -> str:
+    """Encode a PIL image directly; no tensor detour."""
+    return _b64(encode_image(image))
+
+
+if _TORCH_AVAILABLE:
+    image_to_base64.register(torch.Tensor, _tensor_to_base64)
 
 
 def image_to_base64s(tensor) -> Optional[List[str]]:
@@ -210,8 +648,38 @@ def image_to_base64s(tensor) -> Optional[List[str]]:
     if tensor is None:
         return None
 
+    # torchvision's encoder goes straight to libjpeg-turbo from the
+    # uint8 tensor, skipping the tensor->numpy->PIL detour entirely;
+    # any failure (exotic dtype, old torchvision) falls back to PIL
+    # torchvision importing at all implies torch did too
+    if _tv_encode_jpeg is not None:
+        try:
+            t = tensor.detach()
+            if t.ndim == 3:
+                t = t.unsqueeze(0)
+            if t.is_floating_point():
+                t = t.mul(255.0).clamp_(0.0, 255.0).to(torch.uint8)
+            # encode_jpeg wants CHW; materialize the permute once for
+            # the whole batch while still uint8
+            chw = t.permute(0, 3, 1, 2).contiguous()
+            return [
+                _b64(_tv_encode_jpeg(img, quality=95).cpu().numpy().tobytes())
+                for img in chw
+            ]
+        except Exception as e:
+            print(f"[WaveSpeed] torchvision JPEG encode failed, using PIL path: {e}")
+
     images = tensor2images(tensor)
-    return [base64.b64encode(encode_image(image)).decode("utf-8") for image in images]
+
+    # JPEG encoding dominates here and libjpeg releases the GIL, so
+    # multi-image batches encode concurrently; map preserves batch order
+    if len(images) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+            blobs = list(executor.map(encode_image, images))
+    else:
+        blobs = [encode_image(images[0])]
+
+    return [_b64(blob) for blob in blobs]
 
 
 class BaseRequest(BaseModel):
@@ -221,18 +689,33 @@ class BaseRequest(BaseModel):
     All API request classes should inherit from this and implement:
     - build_payload(): Build the API request payload
     - get_api_path(): Return the API endpoint path
-    - field_required(): Return list of required fields
-    - field_order(): Return field ordering for serialization
+    and declare FIELDS_REQUIRED / FIELDS_ORDER class tuples describing
+    the schema (exposed through field_required() / field_order()).
     """
 
+    # Requests are built, serialized once and discarded: frozen lets
+    # pydantic skip mutation bookkeeping (and documents that payloads are
+    # snapshots), extra='forbid' turns typo'd constructor kwargs into
+    # immediate validation errors instead of silently dropped fields
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
+    # Schema constants shared by all instances of a subclass: tuples are
+    # allocated once at class definition instead of a fresh list per call
+    FIELDS_REQUIRED: ClassVar[tuple] = ()
+    FIELDS_ORDER: ClassVar[tuple] = ()
+
     def build_payload(self) -> dict:
         """
         Build the request payload dictionary.
 
+        Serializes the model through pydantic's compiled dumper and drops
+        empty values; subclasses only override this when a payload key is
+        not a plain dump of the fields.
+
         Returns:
             dict: API request payload
         """
-        raise NotImplementedError("Subclasses must implement build_payload")
+        return self._remove_empty_fields(self.model_dump())
 
     def get_api_path(self) -> str:
         """
@@ -243,23 +726,23 @@ class BaseRequest(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement get_api_path")
 
-    def field_required(self) -> List[str]:
+    def field_required(self) -> tuple:
         """
-        Get list of required fields for validation.
+        Get required fields for validation.
 
         Returns:
-            List[str]: List of required field names
+            tuple: Required field names (class-level constant)
         """
-        return []
+        return self.FIELDS_REQUIRED
 
-    def field_order(self) -> List[str]:
+    def field_order(self) -> tuple:
         """
         Get field order for serialization.
 
         Returns:
-            List[str]: Ordered list of field names
+            tuple: Ordered field names (class-level constant)
         """
-        return []
+        return self.FIELDS_ORDER
 
     def _remove_empty_fields(self, payload: dict) -> dict:
         """
@@ -269,9 +752,18 @@ class BaseRequest(BaseModel):
             payload: Raw payload dictionary
 
         Returns:
-            dict: Cleaned payload with empty values removed
+            dict: Cleaned payload with empty values removed; the input
+            dict itself when nothing needed dropping
         """
+        # Most payloads have nothing to drop; returning the dict unchanged
+        # then skips rebuilding it. type(v) is dict avoids the __eq__
+        # dispatch that v != {} pays on every non-dict value
+        if all(
+            v is not None and v != "" and not (type(v) is dict and not v)
+            for v in payload.values()
+        ):
+            return payload
         return {
             k: v for k, v in payload.items()
-            if v is not None and v != "" and v != {}
+            if v is not None and v != "" and not (type(v) is dict and not v)
         }
\ No newline at end of file